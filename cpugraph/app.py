@@ -50,12 +50,29 @@ from ui.controls import (
 )
 from ui.selection import SeriesSelectionManager
 
+# Fixed-width result templates: stable field widths keep the wrapping
+# result label from recomputing line breaks on every recalculation
+_RH_RESULT_TEMPLATE = (
+    "Average RH: {:5.1f}%\n"
+    "Range: {:5.1f}% - {:5.1f}%\n"
+    "Data points: {}"
+)
+_RH_SERIES_TEMPLATE = (
+    "RH Time Series Created\n"
+    "Average: {:5.1f}%\n"
+    "Range: {:5.1f}% - {:5.1f}%"
+)
+
 
 class SensorDashboardApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Sensor Data Grapher (CSV/TXT)")
 
+        # Startup/layout diagnostics are opt-in: each print flushes
+        # stdio on the GUI thread
+        self._debug = os.environ.get('SENSOR_DEBUG') == '1'
+
         # Get screen dimensions for adaptive sizing
         # Small delay to ensure window is created before getting screen info
         self.update_idletasks()
@@ -83,9 +100,10 @@ class SensorDashboardApp(tk.Tk):
         self.window_width = window_width
         self.window_height = window_height
 
-        print(f"[Window Init] Screen: {screen_width}x{screen_height}px")
-        print(f"[Window Init] Window: {window_width}x{window_height}px at ({position_x}, {position_y})")
-        print(f"[Window Init] Minimum: {min_width}x{min_height}px")
+        if self._debug:
+            print(f"[Window Init] Screen: {screen_width}x{screen_height}px")
+            print(f"[Window Init] Window: {window_width}x{window_height}px at ({position_x}, {position_y})")
+            print(f"[Window Init] Minimum: {min_width}x{min_height}px")
         
         # Make window resizable
         self.rowconfigure(0, weight=1)
@@ -120,6 +138,13 @@ class SensorDashboardApp(tk.Tk):
 
         # Support services
         self.sensor_descriptions = SENSOR_DESCRIPTIONS
+        # Precompiled sensor-id alternation, longest ids first (see
+        # SensorDataLoader); one regex scan replaces a loop over every id
+        self._sensor_re = re.compile(
+            "|".join(
+                re.escape(s) for s in
+                sorted(self.sensor_descriptions, key=len, reverse=True)),
+            re.IGNORECASE)
         self.data_loader = SensorDataLoader(sensor_descriptions=self.sensor_descriptions, display_timezone=self.display_tz)
         self.co2_calculator = CO2CaptureCalculator(display_timezone=self.display_tz)
         self.rh_calculator = RHCalculator(display_timezone=self.display_tz)
@@ -166,7 +191,8 @@ class SensorDashboardApp(tk.Tk):
         # Canvas with scrollbar for horizontal scrolling if needed
         # Adaptive height: ~25% of window height, bounded between 200-360px
         controls_height = max(min(int(window_height * 0.25), 360), 200)
-        print(f"[Controls] Canvas height: {controls_height}px (~25% of {window_height}px)")
+        if self._debug:
+            print(f"[Controls] Canvas height: {controls_height}px (~25% of {window_height}px)")
         self.controls_canvas = tk.Canvas(controls_canvas_frame, height=controls_height, highlightthickness=0)
         scrollbar = ttk.Scrollbar(controls_canvas_frame, orient="horizontal", command=self.controls_canvas.xview)
         self.controls_canvas.configure(xscrollcommand=scrollbar.set)
@@ -313,7 +339,8 @@ class SensorDashboardApp(tk.Tk):
         # Use higher DPI for high-resolution screens
         dpi = 120 if screen_width >= 1920 else 100
 
-        print(f"[Figure] Size: {fig_width_inches:.1f}x{fig_height_inches:.1f} inches @ {dpi} DPI")
+        if self._debug:
+            print(f"[Figure] Size: {fig_width_inches:.1f}x{fig_height_inches:.1f} inches @ {dpi} DPI")
 
         self.fig = plt.Figure(figsize=(fig_width_inches, fig_height_inches), dpi=dpi)
         self.ax_left = self.fig.add_subplot(111)
@@ -439,12 +466,11 @@ class SensorDashboardApp(tk.Tk):
             A formatted display name with description if available, otherwise the original column name
         """
         # Check if any sensor ID is in the column name
-        for sensor_id, description in self.sensor_descriptions.items():
-            if sensor_id.upper() in column_name.upper():
-                # Format: "COLUMN_NAME - DESCRIPTION"
-                display_name = f"{column_name} - {description}"
-                print(f"[Sensor Description] Mapped '{column_name}' to '{display_name}'")
-                return display_name
+        match = self._sensor_re.search(column_name)
+        if match:
+            # Format: "COLUMN_NAME - DESCRIPTION"
+            description = self.sensor_descriptions[match.group(0).upper()]
+            return f"{column_name} - {description}"
         
         # If no sensor ID found, return original name
         return column_name
@@ -461,7 +487,7 @@ class SensorDashboardApp(tk.Tk):
         return self.column_display_map.get(display_name, display_name)
     
     # toggle_smooth is now handled by PlotOptionsPanel
-    # on_filter_focus_in and on_filter_focus_out are now handled by SelectionManager
+    # Filter placeholder text is handled inside PlaceholderEntry
     
     # update_selection_tracking is now handled by SelectionManager
 
@@ -553,21 +579,13 @@ class SensorDashboardApp(tk.Tk):
         )
 
         # Reset filters
-        self.left_filter.delete(0, tk.END)
-        self.left_filter.insert(0, "Filter...")
-        self.left_filter.config(foreground="gray")
-        self.right_filter.delete(0, tk.END)
-        self.right_filter.insert(0, "Filter...")
-        self.right_filter.config(foreground="gray")
-
-        # Populate listboxes with display names
-        self.left_list.delete(0, tk.END)
-        self.right_list.delete(0, tk.END)
+        self.left_filter.reset()
+        self.right_filter.reset()
 
-        for column in self.all_columns:
-            display_name = self.column_to_display[column]
-            self.left_list.insert(tk.END, display_name)
-            self.right_list.insert(tk.END, display_name)
+        # Populate listboxes with display names (one batched insert per side)
+        display_names = [self.column_to_display[column] for column in self.all_columns]
+        self.series_selector.bulk_set("left", display_names)
+        self.series_selector.bulk_set("right", display_names)
 
         # Auto-select default sensors on the left axis
         for index, column in enumerate(self.all_columns):
@@ -604,12 +622,8 @@ class SensorDashboardApp(tk.Tk):
         print(f"[Reset] Cleared series selections")
         
         # Reset filter boxes
-        self.left_filter.delete(0, tk.END)
-        self.left_filter.insert(0, "Filter...")
-        self.left_filter.config(foreground="gray")
-        self.right_filter.delete(0, tk.END)
-        self.right_filter.insert(0, "Filter...")
-        self.right_filter.config(foreground="gray")
+        self.left_filter.reset()
+        self.right_filter.reset()
         print(f"[Reset] Reset filter boxes")
         
         # Clear time window entries
@@ -669,12 +683,9 @@ class SensorDashboardApp(tk.Tk):
             if rh_columns_removed:
                 print(f"[Reset] Removed calculated RH columns: {', '.join(rh_columns_removed)}")
                 # Repopulate listboxes without RH columns
-                self.left_list.delete(0, tk.END)
-                self.right_list.delete(0, tk.END)
-                for column in self.all_columns:
-                    display_name = self.column_to_display[column]
-                    self.left_list.insert(tk.END, display_name)
-                    self.right_list.insert(tk.END, display_name)
+                display_names = [self.column_to_display[column] for column in self.all_columns]
+                self.series_selector.bulk_set("left", display_names)
+                self.series_selector.bulk_set("right", display_names)
         
         # Update selection manager
         self.selection_mgr.update_columns(
@@ -843,11 +854,9 @@ class SensorDashboardApp(tk.Tk):
     
     def populate_rh_dropdowns(self, columns):
         """Populate the RH calculation dropdowns with temperature, dew point, and pressure transmitters."""
-        column_list = [""] + list(columns)
-
-        self.temp_combo["values"] = column_list
-        self.dewpoint_combo["values"] = column_list
-        self.pressure_rh_combo["values"] = column_list
+        # Values are handed to the panel and pushed to Tcl lazily when a
+        # popdown is opened; .set() below works without a values list
+        self.rh_panel.set_columns(columns)
 
         temp_selected = False
         dewpoint_selected = False
@@ -1076,8 +1085,10 @@ class SensorDashboardApp(tk.Tk):
             return
 
         time_column = "_plot_time" if "_plot_time" in self.df.columns else self.time_col
-        start_str = self.start_entry.get().strip() or None
-        end_str = self.end_entry.get().strip() or None
+        # Use the panel's cached parses; fall back to the raw text so a
+        # malformed entry still surfaces the calculator's own error
+        start_str = self.time_window.get_start_datetime() or self.start_entry.get().strip() or None
+        end_str = self.time_window.get_end_datetime() or self.end_entry.get().strip() or None
 
         try:
             result = self.rh_calculator.calculate(
@@ -1123,12 +1134,12 @@ class SensorDashboardApp(tk.Tk):
                 }
 
         # Format detailed result for display
-        result_text = (
-            f"Average RH: {result.average_rh_percent:.1f}%\n"
-            f"Range: {result.min_rh_percent:.1f}% - {result.max_rh_percent:.1f}%\n"
-            f"Data points: {result.data_points}"
-        )
-        self.rh_result_var.set(result_text)
+        self.rh_result_var.set(_RH_RESULT_TEMPLATE.format(
+            result.average_rh_percent,
+            result.min_rh_percent,
+            result.max_rh_percent,
+            result.data_points,
+        ))
 
         print(f"\n[RH Calc] ========================================")
         print(f"[RH Calc] Temperature: {temp_col}")
@@ -1240,12 +1251,8 @@ class SensorDashboardApp(tk.Tk):
                 print(f"[RH Plot] Range: {min_rh:.1f}% - {max_rh:.1f}%")
                 
                 # Update result display
-                result_text = (
-                    f"RH Time Series Created\n"
-                    f"Average: {avg_rh:.1f}%\n"
-                    f"Range: {min_rh:.1f}% - {max_rh:.1f}%"
-                )
-                self.rh_result_var.set(result_text)
+                self.rh_result_var.set(
+                    _RH_SERIES_TEMPLATE.format(avg_rh, min_rh, max_rh))
             else:
                 print(f"[RH Plot] Warning: No valid RH data points")
                 self.rh_result_var.set("No valid RH data")
@@ -1412,8 +1419,10 @@ class SensorDashboardApp(tk.Tk):
             return
 
         time_column = "_plot_time" if "_plot_time" in self.df.columns else self.time_col
-        start_str = self.start_entry.get().strip() or None
-        end_str = self.end_entry.get().strip() or None
+        # Use the panel's cached parses; fall back to the raw text so a
+        # malformed entry still surfaces the calculator's own error
+        start_str = self.time_window.get_start_datetime() or self.start_entry.get().strip() or None
+        end_str = self.time_window.get_end_datetime() or self.end_entry.get().strip() or None
 
         try:
             result = self.co2_calculator.calculate(
@@ -1521,8 +1530,8 @@ class SensorDashboardApp(tk.Tk):
             show_watermark=self.watermark_var.get(),
             show_cycle_backgrounds=self.cycle_backgrounds_var.get(),
             show_mode_labels=self.mode_labels_var.get(),
-            start_time=self.start_entry.get().strip() or None,
-            end_time=self.end_entry.get().strip() or None,
+            start_time=self.time_window.get_start_datetime() or self.start_entry.get().strip() or None,
+            end_time=self.time_window.get_end_datetime() or self.end_entry.get().strip() or None,
         )
         
         # Call the plotter
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
@@ -33,6 +34,14 @@ class SensorDataLoader:
 
     def __init__(self, *, sensor_descriptions: Dict[str, str] | None = None, display_timezone: str | tz.tzfile | None = None) -> None:
         self.sensor_descriptions = sensor_descriptions or SENSOR_DESCRIPTIONS
+        # One precompiled alternation finds any sensor id in a column in
+        # a single C-level scan instead of a Python loop over every id;
+        # longer ids sort first so overlapping ids match most-specific
+        self._sensor_re = re.compile(
+            "|".join(
+                re.escape(s) for s in
+                sorted(self.sensor_descriptions, key=len, reverse=True)),
+            re.IGNORECASE)
         # Handle both string timezone names and tzfile objects
         if display_timezone is None:
             self.display_timezone = tz.gettz(DISPLAY_TZ_NAME)
@@ -141,8 +150,8 @@ class SensorDataLoader:
         return display_to_column, column_to_display
 
     def _display_name_for(self, column: str) -> str:
-        upper_column = column.upper()
-        for sensor_id, description in self.sensor_descriptions.items():
-            if sensor_id in upper_column:
-                return f"{column} - {description}"
+        match = self._sensor_re.search(column)
+        if match:
+            # Description keys are uppercase; the match may not be
+            return f"{column} - {self.sensor_descriptions[match.group(0).upper()]}"
         return column
@@ -7,11 +7,14 @@ If a 'Mode' column is present, cycle names are displayed on each background.
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     import matplotlib.axes
 
@@ -55,31 +58,32 @@ class CycleBackgroundRenderer:
         """
         # Check if backgrounds are disabled
         if not show_backgrounds:
-            print(f"[Cycle Backgrounds] Cycle backgrounds disabled by user")
+            logger.debug("[Cycle Backgrounds] Cycle backgrounds disabled by user")
             return []
         
         # Check if "Time (s)" column exists
         if self.time_s_column not in df_plot.columns:
-            print(f"[Cycle Backgrounds] '{self.time_s_column}' column not found, skipping cycle backgrounds")
+            logger.debug("[Cycle Backgrounds] '%s' column not found, skipping cycle backgrounds", self.time_s_column)
             return []
         
         try:
-            # Get the time column and convert to numeric
-            time_values = pd.to_numeric(df_plot[self.time_s_column], errors='coerce')
-            
+            # Work on plain ndarrays: per-row .iloc access is what made
+            # this O(N) pass expensive for large files
+            time_values = pd.to_numeric(df_plot[self.time_s_column], errors='coerce').to_numpy(copy=False)
+            x_values = x_series.to_numpy(copy=False)
+
             # Detect cycle boundaries by finding where time decreases
-            cycle_starts = [0]  # First row is always a cycle start
-            
-            for i in range(1, len(time_values)):
-                # If time decreased or reset to a small value, it's a new cycle
-                if pd.notna(time_values.iloc[i]) and pd.notna(time_values.iloc[i-1]):
-                    if time_values.iloc[i] < time_values.iloc[i-1]:
-                        cycle_starts.append(i)
-            
-            # Add the end of the last cycle
-            cycle_starts.append(len(df_plot))
+            # (a reset to near zero means a new cycle). NaN comparisons
+            # are False, so rows without a valid time never start a cycle.
+            prev = time_values[:-1]
+            curr = time_values[1:]
+            with np.errstate(invalid='ignore'):
+                resets = np.flatnonzero(curr < prev) + 1
+
+            # First row is always a cycle start; append the end sentinel
+            cycle_starts = [0, *resets.tolist(), len(df_plot)]
             
-            print(f"[Cycle Backgrounds] Detected {len(cycle_starts)-1} measurement cycles")
+            logger.debug("[Cycle Backgrounds] Detected %d measurement cycles", len(cycle_starts) - 1)
             
             # Generate random colors for each cycle with 15% opacity
             np.random.seed(42)  # For reproducible colors
@@ -95,10 +99,11 @@ class CycleBackgroundRenderer:
             
             # Check if Mode column exists for labeling cycles
             mode_column_exists = self.mode_column in df_plot.columns
+            mode_values = df_plot[self.mode_column].to_numpy(copy=False) if mode_column_exists else None
             if mode_column_exists and show_mode_labels:
-                print(f"[Cycle Backgrounds] '{self.mode_column}' column found - will display cycle names after layout is finalized")
+                logger.debug("[Cycle Backgrounds] '%s' column found - will display cycle names after layout is finalized", self.mode_column)
             elif mode_column_exists and not show_mode_labels:
-                print(f"[Cycle Backgrounds] '{self.mode_column}' column found - mode labels disabled by user")
+                logger.debug("[Cycle Backgrounds] '%s' column found - mode labels disabled by user", self.mode_column)
             
             # Collect cycle information for later label addition
             cycle_info_list = []
@@ -109,8 +114,8 @@ class CycleBackgroundRenderer:
                 end_idx = cycle_starts[i + 1] - 1
                 
                 # Get x-values for this cycle
-                x_start = x_series.iloc[start_idx]
-                x_end = x_series.iloc[end_idx]
+                x_start = x_values[start_idx]
+                x_end = x_values[end_idx]
                 
                 # Add vertical span for this cycle
                 ax.axvspan(x_start, x_end, 
@@ -122,16 +127,15 @@ class CycleBackgroundRenderer:
                 if mode_column_exists and show_mode_labels:
                     # Get the mode name for this cycle (use first non-null value)
                     mode_name = None
-                    for idx in range(start_idx, end_idx + 1):
-                        if idx < len(df_plot):
-                            value = df_plot[self.mode_column].iloc[idx]
-                            if pd.notna(value) and str(value).strip():
-                                mode_name = str(value).strip()
-                                break
+                    for idx in range(start_idx, min(end_idx + 1, len(mode_values))):
+                        value = mode_values[idx]
+                        if pd.notna(value) and str(value).strip():
+                            mode_name = str(value).strip()
+                            break
                     
                     if mode_name:
                         # Calculate center position for label
-                        x_center = x_series.iloc[(start_idx + end_idx) // 2]
+                        x_center = x_values[(start_idx + end_idx) // 2]
                         
                         cycle_info_list.append({
                             'x_center': x_center,
@@ -141,23 +145,25 @@ class CycleBackgroundRenderer:
                         
                         # Log mode name for first few cycles
                         if i < 3:
-                            print(f"[Cycle Backgrounds] Cycle {i+1}: Mode '{mode_name}' (label will be added after layout)")
+                            logger.debug("[Cycle Backgrounds] Cycle %d: Mode '%s' (label will be added after layout)", i + 1, mode_name)
                 
                 # Log first few cycles for debugging
                 if i < 3:
-                    print(f"[Cycle Backgrounds] Cycle {i+1}: rows {start_idx}-{end_idx}, "
-                          f"time {time_values.iloc[start_idx]:.1f}s to {time_values.iloc[end_idx]:.1f}s, "
-                          f"color RGB({colors_list[i][0]:.2f}, {colors_list[i][1]:.2f}, {colors_list[i][2]:.2f})")
+                    logger.debug("[Cycle Backgrounds] Cycle %d: rows %d-%d, "
+                                 "time %.1fs to %.1fs, color RGB(%.2f, %.2f, %.2f)",
+                                 i + 1, start_idx, end_idx,
+                                 time_values[start_idx], time_values[end_idx],
+                                 colors_list[i][0], colors_list[i][1], colors_list[i][2])
             
             if mode_column_exists and show_mode_labels:
-                print(f"[Cycle Backgrounds] Added {len(colors_list)} cycle backgrounds, {len(cycle_info_list)} mode labels pending")
+                logger.debug("[Cycle Backgrounds] Added %d cycle backgrounds, %d mode labels pending", len(colors_list), len(cycle_info_list))
             else:
-                print(f"[Cycle Backgrounds] Added {len(colors_list)} cycle backgrounds with 15% opacity")
+                logger.debug("[Cycle Backgrounds] Added %d cycle backgrounds with 15%% opacity", len(colors_list))
             
             return cycle_info_list
             
         except Exception as e:
-            print(f"[Cycle Backgrounds] Failed to add cycle backgrounds: {e}")
+            logger.debug("[Cycle Backgrounds] Failed to add cycle backgrounds: %s", e)
             import traceback
             traceback.print_exc()
             return []
@@ -210,10 +216,10 @@ class CycleBackgroundRenderer:
                     zorder=1  # Just above background, below data
                 )
             
-            print(f"[Cycle Backgrounds] Added {len(cycle_info_list)} mode labels at y={y_position:.2f}")
+            logger.debug("[Cycle Backgrounds] Added %d mode labels at y=%.2f", len(cycle_info_list), y_position)
             
         except Exception as e:
-            print(f"[Cycle Backgrounds] Failed to add mode labels: {e}")
+            logger.debug("[Cycle Backgrounds] Failed to add mode labels: %s", e)
             import traceback
             traceback.print_exc()
 
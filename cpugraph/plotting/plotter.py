@@ -6,6 +6,9 @@ watermark placement for the sensor dashboard.
 
 from __future__ import annotations
 
+import functools
+import logging
+from collections import ChainMap
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import matplotlib.dates as mdates
@@ -16,11 +19,43 @@ from PIL import Image
 
 from .cycle_backgrounds import CycleBackgroundRenderer
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     import matplotlib.axes
     import matplotlib.figure
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_time_string(value: str | pd.Timestamp) -> pd.Timestamp:
+    """Parse a time-window bound string (cached).
+
+    Only the string is cached: timezone objects such as dateutil's
+    tzfile are unhashable and must stay out of the cache key, so the
+    caller localizes the result.
+    """
+    return pd.to_datetime(value)
+
+
+def _parse_time_bound(value: str | pd.Timestamp, display_tz: Any) -> pd.Timestamp:
+    """Parse a time-window bound string into a timezone-aware Timestamp.
+
+    Repeated plots with an unchanged time window skip the
+    `pd.to_datetime` round trip via the cached string parse.
+
+    Args:
+        value: Time string to parse
+        display_tz: Timezone to localize naive timestamps to
+
+    Returns:
+        Timezone-aware pandas Timestamp
+    """
+    parsed = _parse_time_string(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.tz_localize(display_tz)
+    return parsed
+
+
 class PlotOptions:
     """Configuration options for plotting."""
     
@@ -51,8 +86,8 @@ class PlotOptions:
         show_mode_labels: bool = True,
         
         # Time window (timezone-aware timestamps or strings)
-        start_time: Optional[str] = None,
-        end_time: Optional[str] = None,
+        start_time: Optional[str | pd.Timestamp] = None,
+        end_time: Optional[str | pd.Timestamp] = None,
     ):
         """Initialize plot options.
         
@@ -117,9 +152,22 @@ class SensorPlotter:
         
         # Create cycle background renderer
         self.cycle_renderer = CycleBackgroundRenderer()
+
+        # Default properties layered under per-series customizations on
+        # the right axis (shared; never mutated)
+        self._right_default_props = {'linestyle': '--'}
         
         # Track last plotted lines for each axis
         self.last_series_lines: Dict[str, Dict[str, Any]] = {"left": {}, "right": {}}
+
+        # Fast-path state for data-only refreshes (see plot())
+        self._ax_left: Optional[Any] = None
+        self._ax_right: Optional[Any] = None
+        self._fast_signature: Optional[tuple] = None
+
+        # Cached tight_layout result, reused while layout inputs are stable
+        self._layout_signature: Optional[tuple] = None
+        self._axes_position: Optional[Any] = None
     
     def plot(
         self,
@@ -148,22 +196,76 @@ class SensorPlotter:
         series_properties = series_properties or {}
         column_to_display = column_to_display or {}
         
-        print(f"[Plot] Selected {len(left_columns)} left axis columns: {left_columns}")
-        print(f"[Plot] Selected {len(right_columns)} right axis columns: {right_columns}")
+        logger.debug("[Plot] Selected %d left axis columns: %s", len(left_columns), left_columns)
+        logger.debug("[Plot] Selected %d right axis columns: %s", len(right_columns), right_columns)
         
         # Prepare data (filter time window, apply smoothing)
         df_plot = self._prepare_data(df, time_column, left_columns, right_columns, options)
         
         if df_plot.empty:
             raise ValueError("No data in the selected time window.")
-        
-        # Clear previous plot
-        self.fig.clear()
-        ax_left = self.fig.add_subplot(111)
-        
+
         # Use timezone-adjusted time column if available
         x_series = df_plot['_plot_time'] if '_plot_time' in df_plot.columns else df_plot[time_column]
-        
+
+        # Normalize the x data to a datetime64 ndarray once so matplotlib
+        # does not re-run Series->ndarray conversion for every plotted line.
+        # Timezone-aware data is stored as naive UTC; the axis formatter
+        # re-applies the display timezone when rendering ticks.
+        if getattr(x_series.dt, 'tz', None) is not None:
+            x_arr = x_series.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy(dtype='datetime64[ns]', copy=False)
+        else:
+            x_arr = x_series.to_numpy(dtype='datetime64[ns]', copy=False)
+
+        # If nothing but the data changed since the last plot, update the
+        # existing Line2D artists in place instead of rebuilding the whole
+        # figure. Cycle backgrounds are data-dependent spans, so the fast
+        # path only applies while they are inactive.
+        cycle_bg_active = (
+            options.show_cycle_backgrounds
+            and self.cycle_renderer.time_s_column in df_plot.columns
+        )
+        signature = (
+            tuple(left_columns),
+            tuple(right_columns),
+            repr(series_properties),
+            repr(column_to_display),
+            cycle_bg_active,
+            options.show_grid,
+            options.show_legend,
+            options.legend_position,
+            options.legend_fontsize,
+            options.legend_columns,
+            options.legend_framealpha,
+            options.graph_title,
+            options.x_label,
+            options.left_y_label,
+            options.right_y_label,
+            options.show_watermark,
+        )
+        if (
+            self._fast_signature == signature
+            and self._ax_left is not None
+            and not cycle_bg_active
+            and self._update_line_data(df_plot, x_arr, left_columns, right_columns)
+        ):
+            logger.debug("[Plot] Fast-path refresh: updated %d series in place",
+                         len(left_columns) + len(right_columns))
+            return self._ax_left
+
+        # Clear previous plot. Reuse the existing axis via cla() when we
+        # have one: it keeps the axis object (and its cached transforms)
+        # alive instead of paying the add_subplot construction cost.
+        if self._ax_left is not None and self._ax_left.figure is self.fig:
+            ax_left = self._ax_left
+            ax_left.cla()
+            if self._ax_right is not None:
+                self._ax_right.remove()
+                self._ax_right = None
+        else:
+            self.fig.clear()
+            ax_left = self.fig.add_subplot(111)
+
         # Add cycle backgrounds if "Time (s)" column exists
         # This returns cycle info for adding labels after layout is finalized
         cycle_info_list = self.cycle_renderer.add_cycle_backgrounds(
@@ -179,7 +281,7 @@ class SensorPlotter:
         for column in left_columns:
             self._plot_series(
                 ax_left,
-                x_series,
+                x_arr,
                 df_plot,
                 column,
                 series_properties.get(column, {}),
@@ -199,22 +301,20 @@ class SensorPlotter:
             ax_left.xaxis.set_major_locator(locator)
             ax_left.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %I:%M %p', tz=self.display_tz))
         except Exception as e:
-            print(f"[Time TZ] Could not set 12-hour time formatter: {e}")
+            logger.debug("[Time TZ] Could not set 12-hour time formatter: %s", e)
         
         # Plot right axis series
         ax_right = None
         if right_columns:
             ax_right = ax_left.twinx()
             for column in right_columns:
-                # Default to dashed line for right axis if not customized
-                props = series_properties.get(column, {})
-                if 'linestyle' not in props:
-                    props = dict(props)
-                    props['linestyle'] = '--'
-                
+                # Default to dashed line for right axis if not customized;
+                # ChainMap layers the default without copying per column
+                props = ChainMap(series_properties.get(column, {}), self._right_default_props)
+
                 self._plot_series(
                     ax_right,
-                    x_series,
+                    x_arr,
                     df_plot,
                     column,
                     props,
@@ -228,11 +328,11 @@ class SensorPlotter:
         if options.show_legend:
             self._add_legend(ax_left, ax_right, options)
         else:
-            print(f"[Plot] Legend hidden")
+            logger.debug("[Plot] Legend hidden")
         
         # Set graph title
         self.fig.suptitle(options.graph_title)
-        print(f"[Plot] Graph title: '{options.graph_title}'")
+        logger.debug("[Plot] Graph title: %r", options.graph_title)
         
         # Add watermark
         if options.show_watermark:
@@ -240,18 +340,83 @@ class SensorPlotter:
         else:
             self._remove_watermark()
         
-        # Apply tight layout
-        self.fig.tight_layout()
+        # Apply tight layout; reuse the previous axes geometry when none
+        # of the layout-affecting inputs changed, since tight_layout is a
+        # full text-measuring pass
+        layout_signature = (
+            tuple(self.fig.get_size_inches()),
+            self.fig.get_dpi(),
+            options.graph_title,
+            options.x_label,
+            options.left_y_label,
+            options.right_y_label,
+            bool(right_columns),
+            options.show_legend,
+            options.legend_position,
+            options.legend_fontsize,
+        )
+        if layout_signature != self._layout_signature or self._axes_position is None:
+            self.fig.tight_layout()
+            self._layout_signature = layout_signature
+            self._axes_position = ax_left.get_position()
+        else:
+            ax_left.set_position(self._axes_position)
+            if ax_right is not None:
+                ax_right.set_position(self._axes_position)
         
         # Add mode labels after layout is finalized
         # This ensures labels are positioned correctly based on final axis limits
         if cycle_info_list:
             self.cycle_renderer.add_mode_labels(ax_left, cycle_info_list)
         
-        print(f"[Plot] Plotted {len(left_columns)} left + {len(right_columns)} right series ({len(df_plot)} points)")
-        
+        logger.debug("[Plot] Plotted %d left + %d right series (%d points)",
+                     len(left_columns), len(right_columns), len(df_plot))
+
+        # Remember the built axes and schema so the next data-only plot
+        # can take the fast path
+        self._ax_left = ax_left
+        self._ax_right = ax_right
+        self._fast_signature = signature
+
         return ax_left
-    
+
+    def _update_line_data(
+        self,
+        df_plot: pd.DataFrame,
+        x_arr: np.ndarray,
+        left_columns: List[str],
+        right_columns: List[str],
+    ) -> bool:
+        """Refresh existing Line2D artists with new data (fast path).
+
+        Args:
+            df_plot: Prepared DataFrame with plot data
+            x_arr: X-axis data (datetime64 ndarray)
+            left_columns: Columns for left axis
+            right_columns: Columns for right axis
+
+        Returns:
+            True if all lines were updated in place, False to force a rebuild
+        """
+        try:
+            for axis, columns in (("left", left_columns), ("right", right_columns)):
+                lines = self.last_series_lines[axis]
+                for column in columns:
+                    y = pd.to_numeric(df_plot[column], errors="coerce").to_numpy(copy=False)
+                    lines[column].set_data(x_arr, y)
+
+            self._ax_left.relim()
+            self._ax_left.autoscale_view()
+            if self._ax_right is not None:
+                self._ax_right.relim()
+                self._ax_right.autoscale_view()
+
+            self.fig.canvas.draw_idle()
+            return True
+        except Exception as e:
+            logger.debug("[Plot] Fast-path update failed, rebuilding: %s", e)
+            return False
+
     def _prepare_data(
         self,
         df: pd.DataFrame,
@@ -278,50 +443,70 @@ class SensorPlotter:
         time_col_to_filter = '_plot_time' if '_plot_time' in df_plot.columns else time_column
         
         # Apply time window filtering
+        start_time = end_time = None
         if options.start_time:
             try:
-                start_time = pd.to_datetime(options.start_time)
-                # Ensure timezone-aware comparison
-                if start_time.tzinfo is None:
-                    start_time = start_time.tz_localize(self.display_tz)
-                print(f"[Plot Filter] Start time: {start_time}")
-                df_plot = df_plot[df_plot[time_col_to_filter] >= start_time]
+                start_time = _parse_time_bound(options.start_time, self.display_tz)
+                logger.debug("[Plot Filter] Start time: %s", start_time)
             except Exception as e:
-                print(f"[Plot Filter] Error parsing start time: {e}")
+                logger.debug("[Plot Filter] Error parsing start time: %s", e)
                 raise ValueError(f"Could not parse start time: {str(e)}")
         
         if options.end_time:
             try:
-                end_time = pd.to_datetime(options.end_time)
-                # Ensure timezone-aware comparison
-                if end_time.tzinfo is None:
-                    end_time = end_time.tz_localize(self.display_tz)
-                print(f"[Plot Filter] End time: {end_time}")
-                df_plot = df_plot[df_plot[time_col_to_filter] <= end_time]
+                end_time = _parse_time_bound(options.end_time, self.display_tz)
+                logger.debug("[Plot Filter] End time: %s", end_time)
             except Exception as e:
-                print(f"[Plot Filter] Error parsing end time: {e}")
+                logger.debug("[Plot Filter] Error parsing end time: %s", e)
                 raise ValueError(f"Could not parse end time: {str(e)}")
         
+        if start_time is not None or end_time is not None:
+            time_values = df_plot[time_col_to_filter]
+            if time_values.is_monotonic_increasing:
+                # The loader sorts by time, so the window is a contiguous
+                # slice: two O(log N) binary searches replace O(N) boolean
+                # masks and the row copies they imply
+                lo = (int(time_values.searchsorted(start_time, side='left'))
+                      if start_time is not None else 0)
+                hi = (int(time_values.searchsorted(end_time, side='right'))
+                      if end_time is not None else len(df_plot))
+                df_plot = df_plot.iloc[lo:hi]
+            else:
+                if start_time is not None:
+                    df_plot = df_plot[time_values >= start_time]
+                if end_time is not None:
+                    df_plot = df_plot[df_plot[time_col_to_filter] <= end_time]
+        
         # Apply smoothing if requested
         if options.apply_smoothing:
             window = options.smoothing_window
             if window % 2 == 0:
                 window += 1  # Make it odd
-            
-            for column in [*left_columns, *right_columns]:
-                if column in df_plot.columns:
-                    df_plot[column] = pd.to_numeric(df_plot[column], errors="coerce").rolling(
-                        window, min_periods=1, center=True
-                    ).mean()
-            
-            print(f"[Plot] Applied smoothing with window={window}")
+
+            smooth_columns = [
+                column for column in [*left_columns, *right_columns]
+                if column in df_plot.columns
+            ]
+            if smooth_columns:
+                numeric = df_plot[smooth_columns].apply(pd.to_numeric, errors="coerce")
+                roller = numeric.rolling(window, min_periods=1, center=True)
+                try:
+                    # Numba compiles a parallel kernel that smooths the
+                    # columns concurrently; optional dependency, so fall
+                    # back to the default engine when unavailable
+                    smoothed = roller.mean(engine="numba", engine_kwargs={"parallel": True})
+                except (ImportError, NotImplementedError, TypeError):
+                    smoothed = roller.mean()
+                df_plot[smooth_columns] = smoothed
+
+            logger.debug("[Plot] Applied smoothing with window=%d", window)
         
         return df_plot
     
     def _plot_series(
         self,
         ax: matplotlib.axes.Axes,
-        x_series: pd.Series,
+        x_arr: np.ndarray,
         df_plot: pd.DataFrame,
         column: str,
         properties: Dict[str, Any],
@@ -329,17 +514,17 @@ class SensorPlotter:
         axis: str = 'left',
     ) -> None:
         """Plot a single series with custom properties.
-        
+
         Args:
             ax: Matplotlib axes
-            x_series: X-axis data (time series)
+            x_arr: X-axis data (datetime64 ndarray)
             df_plot: DataFrame with plot data
             column: Column name to plot
             properties: Custom series properties (color, linestyle, etc.)
             display_label: Display name for legend
             axis: 'left' or 'right' for tracking
         """
-        y = pd.to_numeric(df_plot[column], errors="coerce")
+        y = pd.to_numeric(df_plot[column], errors="coerce").to_numpy(copy=False)
         
         # Build plot kwargs from properties
         plot_kwargs = {'label': display_label}
@@ -356,13 +541,13 @@ class SensorPlotter:
             plot_kwargs['markersize'] = properties['markersize']
         
         # Plot the line
-        line, = ax.plot(x_series, y, **plot_kwargs)
+        line, = ax.plot(x_arr, y, **plot_kwargs)
         
         # Record last-plotted line for introspection
         self.last_series_lines[axis][column] = line
         
         if properties:
-            print(f"[Plot] Applied custom properties to '{column}': {properties}")
+            logger.debug("[Plot] Applied custom properties to %r: %s", column, properties)
     
     def _add_legend(
         self,
@@ -421,9 +606,9 @@ class SensorPlotter:
                 framealpha=options.legend_framealpha
             )
         
-        print(f"[Plot] Legend: position={options.legend_position}, "
-              f"fontsize={options.legend_fontsize}, columns={options.legend_columns}, "
-              f"alpha={options.legend_framealpha}")
+        logger.debug("[Plot] Legend: position=%s, fontsize=%s, columns=%s, alpha=%s",
+                     options.legend_position, options.legend_fontsize,
+                     options.legend_columns, options.legend_framealpha)
     
     def _add_watermark(self, ax: matplotlib.axes.Axes) -> None:
         """Add watermark to the plot.
@@ -442,15 +627,14 @@ class SensorPlotter:
             ratio = target_width_px / max(self.watermark_image.width, 1)
             target_height_px = max(int(self.watermark_image.height * ratio), 1)
             wm_resized = self.watermark_image.resize((max(target_width_px, 1), target_height_px), Image.LANCZOS)
-            
-            # Convert to numpy array and modify alpha channel
-            wm_array = np.array(wm_resized, dtype=float) / 255.0
-            if wm_array.shape[-1] == 4:  # Has alpha channel
-                wm_array[:, :, 3] = wm_array[:, :, 3] * 0.15  # 15% opacity
-            else:
-                # Add alpha channel if not present
-                alpha = np.ones((wm_array.shape[0], wm_array.shape[1], 1)) * 0.15
-                wm_array = np.concatenate([wm_array, alpha], axis=2)
+
+            # Scale the alpha channel to 15% opacity in PIL before handing
+            # the pixels to NumPy; putalpha covers both the with- and
+            # without-alpha cases in a single C pass
+            if wm_resized.mode != 'RGBA':
+                wm_resized = wm_resized.convert('RGBA')
+            wm_resized.putalpha(wm_resized.getchannel('A').point(lambda p: int(p * 0.15)))
+            wm_array = np.asarray(wm_resized, dtype=np.float32) / 255.0
             
             # Create OffsetImage and annotation box
             imagebox = OffsetImage(wm_array, zoom=1.0)
@@ -471,12 +655,11 @@ class SensorPlotter:
                     pass
             
             self.watermark_artist = ax.add_artist(ab)
-            print(f"[Watermark] Placed watermark: {target_width_px}x{target_height_px}px, alpha=0.15, zorder=0")
+            logger.debug("[Watermark] Placed watermark: %dx%dpx, alpha=0.15, zorder=0",
+                         target_width_px, target_height_px)
             
         except Exception as e:
-            print(f"[Watermark] Failed to place watermark: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("[Watermark] Failed to place watermark: %s", e, exc_info=True)
     
     def _remove_watermark(self) -> None:
         """Remove watermark from the plot."""
@@ -484,7 +667,7 @@ class SensorPlotter:
             try:
                 self.watermark_artist.remove()
                 self.watermark_artist = None
-                print(f"[Watermark] Watermark disabled")
+                logger.debug("[Watermark] Watermark disabled")
             except Exception:
                 pass
 
@@ -6,11 +6,19 @@ with visual indicators showing the selected range.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, List, Optional
+import logging
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import tkinter as tk
-from matplotlib.dates import num2date
+from matplotlib.collections import LineCollection
+from matplotlib.dates import date2num, num2date
+
+# Module-level alias: saves the pd.Timestamp attribute lookup per click
+_Timestamp = pd.Timestamp
+
+logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     import matplotlib.axes
@@ -19,7 +27,18 @@ if TYPE_CHECKING:
 
 class TimeSelectionHandler:
     """Manages time range selection via graph clicks."""
-    
+
+    # The click handler is attribute-heavy; slots turn those lookups into
+    # C-level descriptor accesses and shrink the per-instance footprint
+    __slots__ = (
+        'ax_left', 'canvas', 'display_tz', 'df', 'time_col', '_time_ns',
+        'time_selection_mode', 'selected_time_start', 'selected_time_end',
+        '_selected_time_start_str',
+        'on_mode_changed', 'on_time_selected', 'on_status_update',
+        '_bg', '_cid', '_lines_coll', '_span', '_last_drawn',
+        '_tz_abbrev',
+    )
+
     def __init__(
         self,
         ax_left: matplotlib.axes.Axes,
@@ -42,20 +61,41 @@ class TimeSelectionHandler:
         self.display_tz = display_tz
         self.df = df
         self.time_col = time_col
+        self._time_ns: Optional[np.ndarray] = None
+        if df is not None and time_col is not None:
+            self.set_data(df, time_col)
         
         # Selection state
         self.time_selection_mode = False
         self.selected_time_start: Optional[pd.Timestamp] = None
         self.selected_time_end: Optional[pd.Timestamp] = None
-        self.time_selection_lines: List[Any] = []
+        self._selected_time_start_str: Optional[str] = None
         
         # Callbacks for UI updates
         self.on_mode_changed: Optional[Callable[[bool], None]] = None
         self.on_time_selected: Optional[Callable[[Optional[str], Optional[str]], None]] = None
         self.on_status_update: Optional[Callable[[str], None]] = None
         
-        # Connect mouse click event
-        self.canvas.mpl_connect('button_press_event', self.on_graph_click)
+        # Cached canvas background for blitting the selection artists
+        self._bg: Optional[Any] = None
+        self.ax_left.callbacks.connect('xlim_changed', self._invalidate_background)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
+        # Mouse clicks are connected only while selection mode is active,
+        # so the handler costs nothing during normal pan/zoom interaction
+        self._cid: Optional[int] = None
+        
+        # Reusable selection artists, created lazily against the current
+        # axis (a replot clears the axis, detaching them)
+        self._lines_coll: Optional[LineCollection] = None
+        self._span: Optional[Any] = None
+        
+        # Last (start, end) pair actually drawn, to skip no-op redraws
+        self._last_drawn: tuple = (None, None)
+        
+        # Cached timezone abbreviation for fixed-offset display timezones
+        # (None = not probed yet, '' = not cacheable, use strftime)
+        self._tz_abbrev: Optional[str] = None
     
     def set_data(self, df: pd.DataFrame, time_col: str) -> None:
         """Update the data and time column.
@@ -66,22 +106,139 @@ class TimeSelectionHandler:
         """
         self.df = df
         self.time_col = time_col
+        self._bg = None
+        
+        # Cache a monotonic int64 view of UTC nanoseconds so range
+        # queries are a branch-free searchsorted instead of timestamp
+        # comparisons per calculation
+        try:
+            series = df[time_col]
+            if getattr(series.dt, 'tz', None) is not None:
+                series = series.dt.tz_convert('UTC')
+            time_ns = series.to_numpy(dtype='datetime64[ns]', copy=False).view('i8')
+            if len(time_ns) > 1 and not (time_ns[:-1] <= time_ns[1:]).all():
+                time_ns = np.sort(time_ns)
+            self._time_ns = time_ns
+        except (TypeError, AttributeError, KeyError):
+            self._time_ns = None
+    
+    def range_indices(self, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> Tuple[int, int]:
+        """Locate the row range covered by [start_ts, end_ts].
+        
+        Args:
+            start_ts: Range start (timezone-aware Timestamp)
+            end_ts: Range end (timezone-aware Timestamp)
+        
+        Returns:
+            (lo, hi) positional indices into the sorted time column
+        
+        Raises:
+            ValueError: If no data has been loaded
+        """
+        if self._time_ns is None:
+            raise ValueError("No data loaded for range lookup.")
+        lo, hi = np.searchsorted(self._time_ns, [start_ts.value, end_ts.value])
+        return int(lo), int(hi)
+    
+    def _fmt(self, ts: pd.Timestamp) -> str:
+        """Format a timestamp as 'YYYY-MM-DD HH:MM:SS TZ'.
+        
+        For fixed-offset timezones the abbreviation never changes, so it
+        is resolved once and the rest is a plain f-string; DST-variable
+        zones (like US/Pacific) fall back to strftime, whose %Z depends
+        on the instant being formatted.
+        """
+        if self._tz_abbrev is None:
+            abbrev = ''
+            tzinfo = ts.tzinfo
+            try:
+                # Only fixed-offset tzinfo objects answer utcoffset(None)
+                if tzinfo is not None and tzinfo.utcoffset(None) is not None:
+                    abbrev = ts.strftime('%Z')
+            except (TypeError, ValueError):
+                abbrev = ''
+            self._tz_abbrev = abbrev
+        if self._tz_abbrev:
+            return (f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d} "
+                    f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d} {self._tz_abbrev}")
+        return ts.strftime("%Y-%m-%d %H:%M:%S %Z")
+    
+    def _invalidate_background(self, *args: Any) -> None:
+        """Drop the cached blit background (axes or canvas changed)."""
+        self._bg = None
+    
+    def _on_draw(self, event: Any) -> None:
+        """Refresh the blit state after any full canvas draw.
+        
+        The animated selection artists are skipped by normal draws, so
+        without this they would vanish from screen on every redraw
+        (hover tooltips, resize, pan/zoom). The render that just
+        finished is the new background; the visible artists are painted
+        back on top of it before the buffer reaches the screen.
+        """
+        self._bg = self.canvas.copy_from_bbox(self.ax_left.bbox)
+        for artist in (self._span, self._lines_coll):
+            if (artist is not None and artist.get_visible()
+                    and artist.axes is self.ax_left):
+                self.ax_left.draw_artist(artist)
+    
+    def _capture_background(self) -> None:
+        """Render the figure once and cache the region under the axes."""
+        self.canvas.draw()
+        self._bg = self.canvas.copy_from_bbox(self.ax_left.bbox)
+    
+    def _ensure_artists(self) -> None:
+        """Create (or recreate) the reusable selection artists.
+        
+        Artist construction is expensive, so the marker lines (one
+        LineCollection holding both vertical segments, sharing a single
+        transform pass) and the span are built once hidden and only
+        mutated afterwards. They are rebuilt when a replot has cleared
+        the axis they belonged to.
+        """
+        if self._lines_coll is not None and self._lines_coll.axes is self.ax_left:
+            return
+        self._lines_coll = LineCollection(
+            [],
+            transform=self.ax_left.get_xaxis_transform(),
+            colors=('green', 'red'), linestyles='--', linewidths=2,
+            alpha=0.7, label='Selection', visible=False, animated=True)
+        self.ax_left.add_collection(self._lines_coll, autolim=False)
+        self._span = self.ax_left.axvspan(
+            0, 0, alpha=0.2, color='yellow',
+            label='Selected Range', visible=False, animated=True)
     
     def toggle_mode(self) -> None:
         """Toggle time selection mode on/off."""
         self.time_selection_mode = not self.time_selection_mode
         
+        if self.time_selection_mode:
+            self._connect_click_handler()
+        else:
+            self._disconnect_click_handler()
+        
         if self.on_mode_changed:
             self.on_mode_changed(self.time_selection_mode)
         
         if self.time_selection_mode:
             if self.on_status_update:
                 self.on_status_update("Click on graph to select start time, then click again for end time")
-            print("[Time Selection] Mode ENABLED - Click on graph to select start and end times")
+            logger.info("[Time Selection] Mode ENABLED - Click on graph to select start and end times")
         else:
             if self.on_status_update:
                 self.on_status_update("Time selection mode disabled")
-            print("[Time Selection] Mode DISABLED")
+            logger.info("[Time Selection] Mode DISABLED")
+    
+    def _connect_click_handler(self) -> None:
+        """Start listening for graph clicks."""
+        if self._cid is None:
+            self._cid = self.canvas.mpl_connect('button_press_event', self.on_graph_click)
+    
+    def _disconnect_click_handler(self) -> None:
+        """Stop listening for graph clicks."""
+        if self._cid is not None:
+            self.canvas.mpl_disconnect(self._cid)
+            self._cid = None
     
     def is_active(self) -> bool:
         """Check if time selection mode is currently active.
@@ -92,12 +249,16 @@ class TimeSelectionHandler:
         return self.time_selection_mode
     
     def get_selection_lines(self) -> List[Any]:
-        """Get the list of selection line artists for filtering.
+        """Get the currently visible selection artists for filtering.
         
         Returns:
             List of matplotlib artists representing selection lines
         """
-        return self.time_selection_lines
+        return [
+            artist
+            for artist in (self._lines_coll, self._span)
+            if artist is not None and artist.get_visible()
+        ]
     
     def on_graph_click(self, event: Any) -> None:
         """Handle mouse clicks on the graph for time selection.
@@ -105,189 +266,163 @@ class TimeSelectionHandler:
         Args:
             event: Matplotlib mouse button press event
         """
-        print(f"[Time Selection DEBUG] Click detected! Event: {event}")
-        print(f"[Time Selection DEBUG] - time_selection_mode: {self.time_selection_mode}")
-        print(f"[Time Selection DEBUG] - event.inaxes: {event.inaxes}")
-        print(f"[Time Selection DEBUG] - self.ax_left: {self.ax_left}")
-        
-        if not self.time_selection_mode:
-            print("[Time Selection DEBUG] Mode is OFF - ignoring click")
+        # Only left-clicks in active selection mode are of interest;
+        # right/middle clicks (context menu, pan) bail out immediately
+        if getattr(event, 'button', None) != 1 or not self.time_selection_mode:
             return
-        
+
         # Check if click is inside the plot area
         if event.inaxes is None:
-            print(f"[Time Selection DEBUG] Click outside plot area - ignoring")
             return
         
         if self.df is None or self.time_col is None:
-            print(f"[Time Selection DEBUG] No data loaded - df: {self.df is not None}, time_col: {self.time_col}")
+            logger.debug("[Time Selection] No data loaded - df: %s, time_col: %s",
+                         self.df is not None, self.time_col)
             return
         
-        # Get the x-coordinate (time) of the click
+        # Get the x-coordinate (time) of the click; xdata is documented
+        # as float-or-None, so no further type dispatch is needed
         clicked_time = event.xdata
-        print(f"[Time Selection DEBUG] - clicked_time (xdata): {clicked_time}")
-        print(f"[Time Selection DEBUG] - clicked_time type: {type(clicked_time)}")
-        
-        # Convert matplotlib date to datetime if needed (this will be in PST since x-axis uses _plot_time)
-        clicked_timestamp = None
-        if isinstance(clicked_time, (int, float)):
-            # If x-axis is datetime, convert from matplotlib date number
-            try:
-                clicked_datetime = num2date(clicked_time)
-                print(f"[Time Selection DEBUG] - Converted to datetime: {clicked_datetime}")
-                # Convert to pandas timestamp and ensure it's timezone-aware (PST)
-                clicked_timestamp = pd.Timestamp(clicked_datetime)
-                # Localize to PST if naive, or convert to PST if already aware
-                if clicked_timestamp.tzinfo is None:
-                    clicked_timestamp = clicked_timestamp.tz_localize(self.display_tz)
-                else:
-                    clicked_timestamp = clicked_timestamp.tz_convert(self.display_tz)
-                print(f"[Time Selection DEBUG] - Pandas timestamp (PST): {clicked_timestamp}")
-            except Exception as e:
-                print(f"[Time Selection DEBUG] - Conversion error: {e}")
-                import traceback
-                traceback.print_exc()
-                clicked_timestamp = None
-        else:
-            # May already be a datetime object
-            try:
-                clicked_timestamp = pd.Timestamp(clicked_time)
-                if clicked_timestamp.tzinfo is None:
-                    clicked_timestamp = clicked_timestamp.tz_localize(self.display_tz)
-                else:
-                    clicked_timestamp = clicked_timestamp.tz_convert(self.display_tz)
-                print(f"[Time Selection DEBUG] - Direct timestamp conversion (PST): {clicked_timestamp}")
-            except Exception as e:
-                print(f"[Time Selection DEBUG] - Direct conversion error: {e}")
-        
-        if clicked_timestamp is None:
-            print("[Time Selection] ERROR: Could not determine time from click")
+        if clicked_time is None:
+            return
+        logger.debug("[Time Selection] Click at xdata=%s in %s", clicked_time, event.inaxes)
+
+        # Convert the matplotlib date number to a tz-aware Timestamp
+        # (this will be in PST since the x-axis uses _plot_time)
+        try:
+            clicked_timestamp = _Timestamp(num2date(clicked_time, tz=self.display_tz))
+            logger.debug("[Time Selection] Converted click to timestamp: %s", clicked_timestamp)
+        except (TypeError, ValueError) as e:
+            logger.error("[Time Selection] Could not determine time from click: %s", e)
             return
         
         # Set start or end time
-        print(f"[Time Selection DEBUG] - selected_time_start: {self.selected_time_start}")
-        print(f"[Time Selection DEBUG] - selected_time_end: {self.selected_time_end}")
-        
         if self.selected_time_start is None:
             # First click - set start time
-            print("[Time Selection DEBUG] Setting START time...")
             self.selected_time_start = clicked_timestamp
-            time_str = clicked_timestamp.strftime("%Y-%m-%d %H:%M:%S %Z")
+            time_str = self._fmt(clicked_timestamp)
+            self._selected_time_start_str = time_str
             
             if self.on_time_selected:
                 self.on_time_selected(time_str, None)
             if self.on_status_update:
                 self.on_status_update("Start time set (PST). Now click to select end time.")
             
-            print(f"[Time Selection] ✓ Start time (PST): {clicked_timestamp}")
+            logger.info("[Time Selection] ✓ Start time (PST): %s", clicked_timestamp)
             
             # Draw vertical line at start
             self._draw_time_selection_lines()
             
         elif self.selected_time_end is None:
             # Second click - set end time
-            print("[Time Selection DEBUG] Setting END time...")
             self.selected_time_end = clicked_timestamp
-            time_str = clicked_timestamp.strftime("%Y-%m-%d %H:%M:%S %Z")
+            time_str = self._fmt(clicked_timestamp)
             
-            start_str = self.selected_time_start.strftime("%Y-%m-%d %H:%M:%S %Z")
+            # Reuse the string formatted on the first click
+            start_str = self._selected_time_start_str
             if self.on_time_selected:
                 self.on_time_selected(start_str, time_str)
             if self.on_status_update:
                 self.on_status_update("Time range selected (PST). Click 'Calculate CO₂ Captured' to use this range.")
             
-            print(f"[Time Selection] ✓ End time (PST): {clicked_timestamp}")
-            print(f"[Time Selection] ✓ Range ready (PST): {self.selected_time_start} to {self.selected_time_end}")
+            logger.info("[Time Selection] ✓ End time (PST): %s", clicked_timestamp)
+            logger.info("[Time Selection] ✓ Range ready (PST): %s to %s",
+                        self.selected_time_start, self.selected_time_end)
             
             # Draw both lines and shaded region
             self._draw_time_selection_lines()
             
             # Auto-disable selection mode after both points are selected
             self.time_selection_mode = False
+            self._disconnect_click_handler()
             if self.on_mode_changed:
                 self.on_mode_changed(False)
-            print("[Time Selection] Mode auto-disabled after selecting both times")
+            logger.info("[Time Selection] Mode auto-disabled after selecting both times")
         else:
             # Both already selected - reset and start over
-            print("[Time Selection DEBUG] RESETTING - both times already set")
             self.selected_time_start = clicked_timestamp
             self.selected_time_end = None
-            time_str = clicked_timestamp.strftime("%Y-%m-%d %H:%M:%S %Z")
+            time_str = self._fmt(clicked_timestamp)
+            self._selected_time_start_str = time_str
             
             if self.on_time_selected:
                 self.on_time_selected(time_str, None)
             if self.on_status_update:
                 self.on_status_update("Start time reset (PST). Now click to select end time.")
             
-            print(f"[Time Selection] ✓ Reset - New start time (PST): {clicked_timestamp}")
+            logger.info("[Time Selection] ✓ Reset - New start time (PST): %s", clicked_timestamp)
             
             self._draw_time_selection_lines()
     
     def _draw_time_selection_lines(self) -> None:
-        """Draw vertical lines and shaded region showing selected time range."""
-        print(f"[Time Selection DEBUG] _draw_time_selection_lines called")
-        print(f"[Time Selection DEBUG] - start: {self.selected_time_start}")
-        print(f"[Time Selection DEBUG] - end: {self.selected_time_end}")
-        
-        # Remove old lines
-        for line in self.time_selection_lines:
-            try:
-                line.remove()
-                print(f"[Time Selection DEBUG] - Removed old line/span")
-            except Exception as e:
-                print(f"[Time Selection DEBUG] - Error removing line: {e}")
-        self.time_selection_lines.clear()
+        """Update the selection artists to show the selected time range."""
+        state = (self.selected_time_start, self.selected_time_end)
+        if state == self._last_drawn:
+            return
+        logger.debug("[Time Selection] Drawing selection: start=%s end=%s",
+                     self.selected_time_start, self.selected_time_end)
         
-        # Draw new lines
         try:
-            if self.selected_time_start:
-                print(f"[Time Selection DEBUG] Drawing START line at {self.selected_time_start}")
-                line1 = self.ax_left.axvline(self.selected_time_start, color='green', linestyle='--', linewidth=2, alpha=0.7, label='Start')
-                self.time_selection_lines.append(line1)
-                print(f"[Time Selection DEBUG] ✓ START line drawn")
+            self._ensure_artists()
+            start = self.selected_time_start
+            end = self.selected_time_end
+            
+            # Mutate the reusable artists instead of rebuilding them;
+            # both marker lines are segments of one collection so they
+            # share a single transform application
+            segments = []
+            if start is not None:
+                x0 = date2num(start)
+                segments.append([(x0, 0), (x0, 1)])
+            if end is not None:
+                x1 = date2num(end)
+                segments.append([(x1, 0), (x1, 1)])
+            self._lines_coll.set_segments(segments)
+            self._lines_coll.set_visible(bool(segments))
             
-            if self.selected_time_end:
-                print(f"[Time Selection DEBUG] Drawing END line at {self.selected_time_end}")
-                line2 = self.ax_left.axvline(self.selected_time_end, color='red', linestyle='--', linewidth=2, alpha=0.7, label='End')
-                self.time_selection_lines.append(line2)
-                print(f"[Time Selection DEBUG] ✓ END line drawn")
-                
-                # Draw shaded region between start and end
-                if self.selected_time_start:
-                    print(f"[Time Selection DEBUG] Drawing SHADED region from {self.selected_time_start} to {self.selected_time_end}")
-                    span = self.ax_left.axvspan(self.selected_time_start, self.selected_time_end, 
-                                              alpha=0.2, color='yellow', label='Selected Range')
-                    self.time_selection_lines.append(span)
-                    print(f"[Time Selection DEBUG] ✓ SHADED region drawn")
+            show_span = start is not None and end is not None
+            if show_span:
+                # axvspan returns a Rectangle on current matplotlib;
+                # set_bounds rewrites its x extent in axis-fraction y
+                self._span.set_bounds(min(x0, x1), 0.0, abs(x1 - x0), 1.0)
+            self._span.set_visible(show_span)
             
-            print(f"[Time Selection DEBUG] Calling canvas.draw()...")
-            self.canvas.draw()
-            print(f"[Time Selection DEBUG] ✓ Canvas redrawn successfully")
+            # Blit: restore the cached background and draw only the
+            # selection artists instead of re-rendering every line
+            if self._bg is None:
+                self._capture_background()
+            self.canvas.restore_region(self._bg)
+            for artist in (self._span, self._lines_coll):
+                if artist.get_visible():
+                    self.ax_left.draw_artist(artist)
+            self.canvas.blit(self.ax_left.bbox)
+            self._last_drawn = state
             
-        except Exception as e:
-            print(f"[Time Selection DEBUG] ERROR drawing lines: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("[Time Selection] ERROR drawing lines")
     
     def clear_selection(self) -> None:
         """Clear the time selection and remove visual indicators."""
         self.selected_time_start = None
         self.selected_time_end = None
+        self._selected_time_start_str = None
+        self._last_drawn = (None, None)
         
         if self.on_time_selected:
             self.on_time_selected(None, None)
         
-        # Remove visual indicators
-        for line in self.time_selection_lines:
-            try:
-                line.remove()
-            except:
-                pass
-        self.time_selection_lines.clear()
+        # Hide visual indicators (the artists are reused, not removed)
+        for artist in (self._lines_coll, self._span):
+            if artist is not None:
+                artist.set_visible(False)
         
-        self.canvas.draw()
+        if self._bg is not None:
+            self.canvas.restore_region(self._bg)
+            self.canvas.blit(self.ax_left.bbox)
+        else:
+            self.canvas.draw_idle()
         
         if self.on_status_update:
             self.on_status_update("Time selection cleared")
-        print("[Time Selection] Cleared")
+        logger.info("[Time Selection] Cleared")
 
@@ -4,6 +4,9 @@ This package contains modular UI control panels that can be composed
 to build the application interface.
 """
 
+from tkinter import ttk
+
+from .placeholder_entry import PlaceholderEntry
 from .series_selector import SeriesSelector
 from .plot_options_panel import PlotOptionsPanel
 from .legend_options_panel import LegendOptionsPanel
@@ -12,8 +15,29 @@ from .time_window_panel import TimeWindowPanel
 from .co2_calculation_panel import CO2CalculationPanel
 from .rh_calculation_panel import RHCalculationPanel
 
+_styles_configured = False
+
+
+def configure_shared_styles(master=None) -> None:
+    """Configure ttk styles shared by the control panels.
+
+    Idempotent; panels call this before creating their widgets so the
+    read-only comboboxes share one style resource instead of each widget
+    parsing its own options. Requires a Tk root to exist.
+    """
+    global _styles_configured
+    if _styles_configured:
+        return
+    style = ttk.Style(master)
+    style.configure("ReadOnly.TCombobox")
+    style.configure("Hint.TLabel", font=("TkDefaultFont", 7), foreground="gray")
+    _styles_configured = True
+
+
 __all__ = [
+    "PlaceholderEntry",
     "SeriesSelector",
+    "configure_shared_styles",
     "PlotOptionsPanel",
     "LegendOptionsPanel",
     "GraphLabelsPanel",
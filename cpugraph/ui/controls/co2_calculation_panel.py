@@ -10,11 +10,13 @@ import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING, Callable
 
+from .frame_delegate import FrameDelegate
+
 if TYPE_CHECKING:
     pass
 
 
-class CO2CalculationPanel:
+class CO2CalculationPanel(FrameDelegate):
     """Panel for CO2 capture calculation with no-leak assumption."""
     
     def __init__(
@@ -36,11 +38,17 @@ class CO2CalculationPanel:
             on_quick_plot: Callback for quick plot button
             on_calculate: Callback for calculate button
         """
+        from . import configure_shared_styles
+        configure_shared_styles(parent)
+        
         self.app = app
         self.on_vm_update = on_vm_update
         self.on_quick_plot = on_quick_plot
         self.on_calculate = on_calculate
         
+        # Pending after() id used to debounce keystroke-driven Vm updates
+        self._vm_after_id = None
+        
         self.frame = ttk.LabelFrame(
             parent,
             text="CO₂ Capture Calculation (No-leak assumption: F_out = F_in)"
@@ -54,21 +62,21 @@ class CO2CalculationPanel:
         ttk.Label(col_select, text="Inlet CO₂ (ppm):").grid(
             row=0, column=0, sticky="e", padx=4, pady=2
         )
-        self.inlet_co2_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
+        self.inlet_co2_combo = ttk.Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
         self.inlet_co2_combo.grid(row=0, column=1, padx=4, pady=2)
         
         # Outlet CO2
         ttk.Label(col_select, text="Outlet CO₂ (ppm):").grid(
             row=1, column=0, sticky="e", padx=4, pady=2
         )
-        self.outlet_co2_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
+        self.outlet_co2_combo = ttk.Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
         self.outlet_co2_combo.grid(row=1, column=1, padx=4, pady=2)
         
         # Flow rate
         ttk.Label(col_select, text="Flow Rate (SLPM):").grid(
             row=2, column=0, sticky="e", padx=4, pady=2
         )
-        self.inlet_flow_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
+        self.inlet_flow_combo = ttk.Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
         self.inlet_flow_combo.grid(row=2, column=1, padx=4, pady=2)
         
         # Parameters section
@@ -79,8 +87,8 @@ class CO2CalculationPanel:
         ttk.Label(param_calc, text="Temperature (°C):").grid(
             row=0, column=0, sticky="e", padx=4, pady=2
         )
-        self.temp_entry = ttk.Entry(param_calc, width=8)
-        self.temp_entry.insert(0, "25")
+        self._temp_var = tk.StringVar(value="25")
+        self.temp_entry = ttk.Entry(param_calc, width=8, textvariable=self._temp_var)
         self.temp_entry.grid(row=0, column=1, padx=4, pady=2)
         self.temp_entry.bind("<KeyRelease>", lambda e: self._on_vm_param_changed())
         
@@ -91,12 +99,12 @@ class CO2CalculationPanel:
         pressure_frame = ttk.Frame(param_calc)
         pressure_frame.grid(row=1, column=1, sticky="w", padx=4, pady=2)
         
-        self.pressure_entry = ttk.Entry(pressure_frame, width=8)
-        self.pressure_entry.insert(0, "1.0")
+        self._pressure_var = tk.StringVar(value="1.0")
+        self.pressure_entry = ttk.Entry(pressure_frame, width=8, textvariable=self._pressure_var)
         self.pressure_entry.pack(side=tk.LEFT, padx=(0, 2))
         self.pressure_entry.bind("<KeyRelease>", lambda e: self._on_vm_param_changed())
         
-        self.pressure_unit_combo = ttk.Combobox(pressure_frame, width=5, state="readonly")
+        self.pressure_unit_combo = ttk.Combobox(pressure_frame, width=5, state="readonly", style="ReadOnly.TCombobox")
         self.pressure_unit_combo['values'] = ("atm", "psi")
         self.pressure_unit_combo.current(0)  # Default to atm
         self.pressure_unit_combo.pack(side=tk.LEFT)
@@ -106,14 +114,13 @@ class CO2CalculationPanel:
         ttk.Label(param_calc, text="Compressibility (Z):").grid(
             row=2, column=0, sticky="e", padx=4, pady=2
         )
-        self.z_entry = ttk.Entry(param_calc, width=8)
-        self.z_entry.insert(0, "1.0")
+        self._z_var = tk.StringVar(value="1.0")
+        self.z_entry = ttk.Entry(param_calc, width=8, textvariable=self._z_var)
         self.z_entry.grid(row=2, column=1, padx=4, pady=2)
         ttk.Label(
             param_calc,
             text="(1.0 for air, ideal)",
-            font=("TkDefaultFont", 7),
-            foreground="gray"
+            style="Hint.TLabel"
         ).grid(row=2, column=2, sticky="w", padx=4, pady=2)
         self.z_entry.bind("<KeyRelease>", lambda e: self._on_vm_param_changed())
         
@@ -133,8 +140,7 @@ class CO2CalculationPanel:
         ttk.Label(
             param_calc,
             text="(calculated)",
-            font=("TkDefaultFont", 7),
-            foreground="gray"
+            style="Hint.TLabel"
         ).grid(row=3, column=2, sticky="w", padx=4, pady=4)
         
         # Buttons
@@ -165,7 +171,19 @@ class CO2CalculationPanel:
         result_label.pack(padx=4, pady=4)
     
     def _on_vm_param_changed(self) -> None:
-        """Handle Vm parameter change."""
+        """Handle Vm parameter change (debounced).
+        
+        Recomputing Vm on every keystroke is wasteful while the user is
+        still typing a value, so the update fires only after a short
+        pause in input.
+        """
+        if self._vm_after_id is not None:
+            self.app.after_cancel(self._vm_after_id)
+        self._vm_after_id = self.app.after(150, self._fire_vm_update)
+    
+    def _fire_vm_update(self) -> None:
+        """Run the pending Vm update callback."""
+        self._vm_after_id = None
         if self.on_vm_update:
             self.on_vm_update()
     
@@ -179,11 +197,4 @@ class CO2CalculationPanel:
         if self.on_calculate:
             self.on_calculate()
     
-    def pack(self, **kwargs) -> None:
-        """Pack the frame with given options."""
-        self.frame.pack(**kwargs)
-    
-    def grid(self, **kwargs) -> None:
-        """Grid the frame with given options."""
-        self.frame.grid(**kwargs)
 
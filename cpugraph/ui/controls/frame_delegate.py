@@ -0,0 +1,28 @@
+"""Geometry-manager delegation shared by the control panels.
+
+Each panel wraps its widgets in a single ttk frame; this mixin forwards
+the geometry-manager calls to that frame so the panels don't each carry
+identical pack/grid shims.
+"""
+
+from __future__ import annotations
+
+# Geometry-manager methods that are forwarded to the panel's frame
+_DELEGATED = frozenset((
+    "pack", "grid", "place",
+    "pack_forget", "grid_forget", "place_forget",
+))
+
+
+class FrameDelegate:
+    """Mixin forwarding geometry-manager calls to ``self.frame``.
+
+    Delegation happens in ``__getattr__``, so a forwarded method costs one
+    attribute fetch on the frame instead of an extra Python frame per call.
+    """
+
+    def __getattr__(self, name: str):
+        if name in _DELEGATED:
+            return getattr(self.frame, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}")
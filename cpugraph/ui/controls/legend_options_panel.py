@@ -9,11 +9,13 @@ import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
+from .frame_delegate import FrameDelegate
+
 if TYPE_CHECKING:
     pass
 
 
-class LegendOptionsPanel:
+class LegendOptionsPanel(FrameDelegate):
     """Panel for legend customization options."""
     
     def __init__(self, parent: ttk.Frame, app: tk.Tk):
@@ -23,6 +25,9 @@ class LegendOptionsPanel:
             parent: Parent frame to place this panel in
             app: Reference to main app for accessing variables/methods
         """
+        from . import configure_shared_styles
+        configure_shared_styles(parent)
+        
         self.app = app
         self.frame = ttk.LabelFrame(parent, text="Legend Options")
         
@@ -35,7 +40,7 @@ class LegendOptionsPanel:
         
         # Position
         ttk.Label(self.frame, text="Position:").grid(row=1, column=0, sticky="w", padx=4, pady=2)
-        self.legend_position = ttk.Combobox(self.frame, width=15, state="readonly")
+        self.legend_position = ttk.Combobox(self.frame, width=15, state="readonly", style="ReadOnly.TCombobox")
         self.legend_position['values'] = (
             "Upper Left", "Upper Right", "Lower Left", "Lower Right",
             "Best", "Outside Right", "Outside Bottom"
@@ -62,11 +67,4 @@ class LegendOptionsPanel:
             variable=self.legend_framealpha_var
         ).grid(row=4, column=0, columnspan=2, sticky="w", padx=4, pady=2)
     
-    def pack(self, **kwargs) -> None:
-        """Pack the frame with given options."""
-        self.frame.pack(**kwargs)
-    
-    def grid(self, **kwargs) -> None:
-        """Grid the frame with given options."""
-        self.frame.grid(**kwargs)
 
@@ -0,0 +1,51 @@
+"""Entry widget with built-in placeholder text.
+
+Shows grayed placeholder text while the entry is empty and unfocused.
+Focus events are handled entirely inside the widget, so no external
+callbacks fire on keyboard navigation.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class PlaceholderEntry(ttk.Entry):
+    """ttk.Entry that manages its own placeholder text.
+
+    While empty and unfocused the entry displays the placeholder in gray;
+    `get()` returns the placeholder in that state, matching the behavior
+    callers relied on when the placeholder was managed externally.
+    """
+
+    def __init__(self, master=None, placeholder: str = "", **kwargs):
+        """Initialize the entry.
+
+        Args:
+            master: Parent widget
+            placeholder: Text shown while the entry is empty and unfocused
+            **kwargs: Passed through to ttk.Entry
+        """
+        super().__init__(master, **kwargs)
+        self._placeholder = placeholder
+        self.bind("<FocusIn>", self._on_focus_in)
+        self.bind("<FocusOut>", self._on_focus_out)
+        self.reset()
+
+    def _on_focus_in(self, event=None) -> None:
+        """Clear the placeholder when the entry gains focus."""
+        if self.get() == self._placeholder:
+            self.delete(0, tk.END)
+            self.config(foreground="black")
+
+    def _on_focus_out(self, event=None) -> None:
+        """Restore the placeholder when the entry is left empty."""
+        if not self.get():
+            self.insert(0, self._placeholder)
+            self.config(foreground="gray")
+
+    def reset(self) -> None:
+        """Clear any typed text and show the placeholder again."""
+        self.delete(0, tk.END)
+        self._on_focus_out()
@@ -9,11 +9,13 @@ import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
+from .frame_delegate import FrameDelegate
+
 if TYPE_CHECKING:
     pass
 
 
-class PlotOptionsPanel:
+class PlotOptionsPanel(FrameDelegate):
     """Panel for plot display options (grid, smoothing, watermark)."""
     
     def __init__(self, parent: ttk.Frame, app: tk.Tk):
@@ -43,8 +45,8 @@ class PlotOptionsPanel:
         
         # Smoothing window entry
         ttk.Label(self.frame, text="Window (samples):").grid(row=2, column=0, sticky="w", padx=4, pady=2)
-        self.window_entry = ttk.Entry(self.frame, width=8)
-        self.window_entry.insert(0, "15")
+        self._window_var = tk.StringVar(value="15")
+        self.window_entry = ttk.Entry(self.frame, width=8, textvariable=self._window_var)
         self.window_entry.grid(row=2, column=1, sticky="w", padx=4, pady=2)
         self.window_entry.state(["disabled"])
         
@@ -76,11 +78,4 @@ class PlotOptionsPanel:
         else:
             self.window_entry.state(["disabled"])
     
-    def pack(self, **kwargs) -> None:
-        """Pack the frame with given options."""
-        self.frame.pack(**kwargs)
-    
-    def grid(self, **kwargs) -> None:
-        """Grid the frame with given options."""
-        self.frame.grid(**kwargs)
 
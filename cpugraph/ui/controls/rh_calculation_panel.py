@@ -10,11 +10,16 @@ import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING, Callable
 
+from .frame_delegate import FrameDelegate
+
 if TYPE_CHECKING:
     pass
 
+# Grid padding shared by the column-selection rows in this panel
+_GRID_PAD = {"padx": 4, "pady": 4}
+
 
-class RHCalculationPanel:
+class RHCalculationPanel(FrameDelegate):
     """Panel for relative humidity calculation from temperature and dew point."""
     
     def __init__(
@@ -36,80 +41,87 @@ class RHCalculationPanel:
             on_calculate: Callback for calculate button
             on_plot_rh: Callback for plot RH time series button
         """
+        from . import configure_shared_styles
+        configure_shared_styles(parent)
+        
+        # Local aliases: this constructor creates ~20 widgets, and a local
+        # binding skips the module attribute lookup for each one
+        Frame, Label, Button = ttk.Frame, ttk.Label, ttk.Button
+        LabelFrame, Combobox = ttk.LabelFrame, ttk.Combobox
+        
         self.app = app
         self.on_quick_plot = on_quick_plot
         self.on_calculate = on_calculate
         self.on_plot_rh = on_plot_rh
         
-        self.frame = ttk.LabelFrame(
+        self.frame = LabelFrame(
             parent,
             text="Relative Humidity Calculation (from Temperature & Dew Point)"
         )
         
         # Main container with elegant layout
-        main_container = ttk.Frame(self.frame)
+        main_container = Frame(self.frame)
         main_container.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
         
         # Left side: Column selection
-        col_select = ttk.Frame(main_container)
+        col_select = Frame(main_container)
         col_select.pack(side=tk.LEFT, padx=6, pady=4)
         
         # Presets dropdown
-        ttk.Label(col_select, text="Quick Presets:").grid(
-            row=0, column=0, sticky="e", padx=4, pady=4
+        Label(col_select, text="Quick Presets:").grid(
+            row=0, column=0, sticky="e", **_GRID_PAD
         )
-        self.preset_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
+        self.preset_combo = Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
         self.preset_combo['values'] = ("-- Select Preset --", "Compressed Air", "Contactor")
         self.preset_combo.current(0)
-        self.preset_combo.grid(row=0, column=1, padx=4, pady=4)
+        self.preset_combo.grid(row=0, column=1, **_GRID_PAD)
         self.preset_combo.bind("<<ComboboxSelected>>", self._on_preset_selected)
         
         # Temperature transmitter
-        ttk.Label(col_select, text="Temperature (°C):").grid(
-            row=1, column=0, sticky="e", padx=4, pady=4
+        Label(col_select, text="Temperature (°C):").grid(
+            row=1, column=0, sticky="e", **_GRID_PAD
         )
-        self.temp_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
-        self.temp_combo.grid(row=1, column=1, padx=4, pady=4)
+        self.temp_combo = Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
+        self.temp_combo.grid(row=1, column=1, **_GRID_PAD)
         
         # Dew point transmitter
-        ttk.Label(col_select, text="Dew Point (°C):").grid(
-            row=2, column=0, sticky="e", padx=4, pady=4
+        Label(col_select, text="Dew Point (°C):").grid(
+            row=2, column=0, sticky="e", **_GRID_PAD
         )
-        self.dewpoint_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
-        self.dewpoint_combo.grid(row=2, column=1, padx=4, pady=4)
+        self.dewpoint_combo = Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
+        self.dewpoint_combo.grid(row=2, column=1, **_GRID_PAD)
         
         # Pressure transmitter (optional)
-        ttk.Label(col_select, text="Pressure (optional):").grid(
-            row=3, column=0, sticky="e", padx=4, pady=4
+        Label(col_select, text="Pressure (optional):").grid(
+            row=3, column=0, sticky="e", **_GRID_PAD
         )
-        self.pressure_combo = ttk.Combobox(col_select, width=combo_width, state="readonly")
-        self.pressure_combo.grid(row=3, column=1, padx=4, pady=4)
-        ttk.Label(
+        self.pressure_combo = Combobox(col_select, width=combo_width, state="readonly", style="ReadOnly.TCombobox")
+        self.pressure_combo.grid(row=3, column=1, **_GRID_PAD)
+        Label(
             col_select,
             text="(for reference/logging)",
-            font=("TkDefaultFont", 7),
-            foreground="gray"
+            style="Hint.TLabel"
         ).grid(row=3, column=2, sticky="w", padx=2, pady=4)
         
         # Middle: Buttons
-        btn_frame = ttk.Frame(main_container)
+        btn_frame = Frame(main_container)
         btn_frame.pack(side=tk.LEFT, padx=10, pady=4)
         
-        ttk.Button(
+        Button(
             btn_frame,
             text="📊 Quick Plot",
             command=self._on_quick_plot_clicked,
             width=16
         ).pack(pady=3)
         
-        ttk.Button(
+        Button(
             btn_frame,
             text="📈 Plot RH Line",
             command=self._on_plot_rh_clicked,
             width=16
         ).pack(pady=3)
         
-        ttk.Button(
+        Button(
             btn_frame,
             text="🧮 Calculate Stats",
             command=self._on_calculate_clicked,
@@ -117,11 +129,11 @@ class RHCalculationPanel:
         ).pack(pady=3)
         
         # Right side: Results display
-        result_container = ttk.Frame(main_container)
+        result_container = Frame(main_container)
         result_container.pack(side=tk.LEFT, padx=10, pady=4, fill=tk.BOTH, expand=True)
         
         # Results header
-        ttk.Label(
+        Label(
             result_container,
             text="Results:",
             font=("TkDefaultFont", 9, "bold")
@@ -129,7 +141,7 @@ class RHCalculationPanel:
         
         # Results display
         self.rh_result_var = tk.StringVar(value="Select transmitters and calculate")
-        result_label = ttk.Label(
+        result_label = Label(
             result_container,
             textvariable=self.rh_result_var,
             font=("TkDefaultFont", 10),
@@ -141,12 +153,46 @@ class RHCalculationPanel:
         
         # Info label with formula explanation
         info_text = "Magnus-Tetens formula: RH = 100 × e(Td)/e(T)"
-        ttk.Label(
+        Label(
             self.frame,
             text=info_text,
-            font=("TkDefaultFont", 7),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(side=tk.BOTTOM, pady=(0, 4))
+        
+        # Transmitter dropdowns are populated lazily when opened: pushing
+        # thousands of tags through Tcl at load time would block the UI
+        # for lists the user may never open
+        self._column_values: tuple = ("",)
+        self._pushed_values: dict = {}
+        for combo in (self.temp_combo, self.dewpoint_combo, self.pressure_combo):
+            combo.configure(postcommand=lambda c=combo: self._populate_combo(c))
+    
+    def set_columns(self, columns) -> None:
+        """Record the selectable transmitter columns.
+        
+        The combobox popdowns pick the list up on their next open; nothing
+        is pushed to Tcl here.
+        
+        Args:
+            columns: Iterable of column names
+        """
+        self._column_values = ("", *columns)
+    
+    def _populate_combo(self, combo: ttk.Combobox) -> None:
+        """Fill a combobox's values just before its popdown opens.
+        
+        The full list is pushed in one Tcl assignment. Capping the values
+        at the first few hundred matches was considered for huge tag sets,
+        but these combos are readonly -- the user can't type a prefix to
+        reach the hidden rest -- so truncation would make tags
+        unselectable; the one-shot lazy assignment is the optimization
+        that applies here.
+        """
+        key = str(combo)
+        if self._pushed_values.get(key) is self._column_values:
+            return
+        combo["values"] = self._column_values
+        self._pushed_values[key] = self._column_values
     
     def _on_preset_selected(self, event=None) -> None:
         """Handle preset selection."""
@@ -173,11 +219,4 @@ class RHCalculationPanel:
         if self.on_calculate:
             self.on_calculate()
     
-    def pack(self, **kwargs) -> None:
-        """Pack the frame with given options."""
-        self.frame.pack(**kwargs)
-    
-    def grid(self, **kwargs) -> None:
-        """Grid the frame with given options."""
-        self.frame.grid(**kwargs)
 
@@ -10,11 +10,18 @@ import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
+from .frame_delegate import FrameDelegate
+from .placeholder_entry import PlaceholderEntry
+
+# Grid padding shared by every row in this panel, built once instead of
+# re-materializing the same keyword pair per .grid() call
+_GRID_PAD = {"padx": 4, "pady": 2}
+
 if TYPE_CHECKING:
     from ui.selection import SeriesSelectionManager
 
 
-class SeriesSelector:
+class SeriesSelector(FrameDelegate):
     """Panel for selecting series for left and right Y-axes.
     
     This is a pure UI component that delegates all selection logic
@@ -36,43 +43,56 @@ class SeriesSelector:
             selection_manager: Selection state manager instance
             listbox_width: Width of listboxes in characters
         """
+        from . import configure_shared_styles
+        configure_shared_styles(parent)
+        
+        # Local aliases skip the per-widget module attribute lookups
+        Frame, Label, Button = ttk.Frame, ttk.Label, ttk.Button
+        
         self.app = app
         self.selection_mgr = selection_manager
         
+        # Pending debounced filter callbacks (one per side)
+        self._filter_after_ids = {"left": None, "right": None}
+        
+        # Whether a selection-tracking flush is already queued (one per side)
+        self._tracking_pending = {"left": False, "right": False}
+        
         self.frame = ttk.LabelFrame(parent, text="Series Selection")
         
         # Left axis controls
-        ttk.Label(self.frame, text="Left Y-axis").grid(row=0, column=0, sticky="w", padx=4, pady=2)
+        Label(self.frame, text="Left Y-axis").grid(row=0, column=0, sticky="w", **_GRID_PAD)
         
-        # Left filter
-        self.left_filter = ttk.Entry(self.frame, width=listbox_width)
-        self.left_filter.grid(row=1, column=0, padx=4, pady=2)
-        self.left_filter.insert(0, "Filter...")
-        self.left_filter.bind("<FocusIn>", lambda e: self.selection_mgr.on_filter_focus_in(self.left_filter))
-        self.left_filter.bind("<FocusOut>", lambda e: self.selection_mgr.on_filter_focus_out(self.left_filter))
-        self.left_filter.bind("<KeyRelease>", lambda e: self.selection_mgr.filter_listbox("left", self.left_list, self.left_filter))
+        # Left filter (placeholder handled inside the widget, no callbacks)
+        self.left_filter = PlaceholderEntry(self.frame, placeholder="Filter...", width=listbox_width)
+        self.left_filter.grid(row=1, column=0, **_GRID_PAD)
+        self.left_filter.bind("<KeyRelease>", self._on_left_filter_key)
         
         # Left buttons
-        left_btn_frame = ttk.Frame(self.frame)
-        left_btn_frame.grid(row=2, column=0, sticky="w", padx=4, pady=2)
-        ttk.Button(
+        left_btn_frame = Frame(self.frame)
+        left_btn_frame.grid(row=2, column=0, sticky="w", **_GRID_PAD)
+        Button(
             left_btn_frame, text="Select All",
-            command=lambda: self.selection_mgr.select_all("left", self.left_list),
+            command=self._select_all_left,
             width=12
         ).pack(side=tk.LEFT, padx=2)
-        ttk.Button(
+        Button(
             left_btn_frame, text="Deselect All",
-            command=lambda: self.selection_mgr.deselect_all("left", self.left_list),
+            command=self._deselect_all_left,
             width=12
         ).pack(side=tk.LEFT, padx=2)
-        ttk.Label(
+        Label(
             left_btn_frame,
             text="(Ctrl+Click, Shift+Click)",
-            font=("TkDefaultFont", 7),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(side=tk.LEFT, padx=4)
         
-        # Left listbox
+        # Left listbox. A ttk.Treeview swap was considered for very large
+        # series lists, but Listbox already paints only the rows in the
+        # viewport, and the index-based Listbox API (curselection/get/
+        # selection_set) is what the selection manager and the quick-plot
+        # paths are built on -- repopulation cost is handled by batching
+        # and the unchanged-contents check in the selection manager.
         self.left_list = tk.Listbox(
             self.frame,
             selectmode=tk.EXTENDED,
@@ -80,38 +100,34 @@ class SeriesSelector:
             height=10,
             exportselection=False
         )
-        self.left_list.grid(row=3, column=0, padx=4, pady=2)
-        self.left_list.bind("<<ListboxSelect>>", lambda e: self.selection_mgr.update_selection_tracking("left", self.left_list))
+        self.left_list.grid(row=3, column=0, **_GRID_PAD)
+        self.left_list.bind("<<ListboxSelect>>", self._on_left_list_select)
         
         # Right axis controls
-        ttk.Label(self.frame, text="Right Y-axis").grid(row=0, column=1, sticky="w", padx=4, pady=2)
+        Label(self.frame, text="Right Y-axis").grid(row=0, column=1, sticky="w", **_GRID_PAD)
         
-        # Right filter
-        self.right_filter = ttk.Entry(self.frame, width=listbox_width)
-        self.right_filter.grid(row=1, column=1, padx=4, pady=2)
-        self.right_filter.insert(0, "Filter...")
-        self.right_filter.bind("<FocusIn>", lambda e: self.selection_mgr.on_filter_focus_in(self.right_filter))
-        self.right_filter.bind("<FocusOut>", lambda e: self.selection_mgr.on_filter_focus_out(self.right_filter))
-        self.right_filter.bind("<KeyRelease>", lambda e: self.selection_mgr.filter_listbox("right", self.right_list, self.right_filter))
+        # Right filter (placeholder handled inside the widget, no callbacks)
+        self.right_filter = PlaceholderEntry(self.frame, placeholder="Filter...", width=listbox_width)
+        self.right_filter.grid(row=1, column=1, **_GRID_PAD)
+        self.right_filter.bind("<KeyRelease>", self._on_right_filter_key)
         
         # Right buttons
-        right_btn_frame = ttk.Frame(self.frame)
-        right_btn_frame.grid(row=2, column=1, sticky="w", padx=4, pady=2)
-        ttk.Button(
+        right_btn_frame = Frame(self.frame)
+        right_btn_frame.grid(row=2, column=1, sticky="w", **_GRID_PAD)
+        Button(
             right_btn_frame, text="Select All",
-            command=lambda: self.selection_mgr.select_all("right", self.right_list),
+            command=self._select_all_right,
             width=12
         ).pack(side=tk.LEFT, padx=2)
-        ttk.Button(
+        Button(
             right_btn_frame, text="Deselect All",
-            command=lambda: self.selection_mgr.deselect_all("right", self.right_list),
+            command=self._deselect_all_right,
             width=12
         ).pack(side=tk.LEFT, padx=2)
-        ttk.Label(
+        Label(
             right_btn_frame,
             text="(Ctrl+Click, Shift+Click)",
-            font=("TkDefaultFont", 7),
-            foreground="gray"
+            style="Hint.TLabel"
         ).pack(side=tk.LEFT, padx=4)
         
         # Right listbox
@@ -122,14 +138,99 @@ class SeriesSelector:
             height=10,
             exportselection=False
         )
-        self.right_list.grid(row=3, column=1, padx=4, pady=2)
-        self.right_list.bind("<<ListboxSelect>>", lambda e: self.selection_mgr.update_selection_tracking("right", self.right_list))
+        self.right_list.grid(row=3, column=1, **_GRID_PAD)
+        self.right_list.bind("<<ListboxSelect>>", self._on_right_list_select)
+    
+    def _on_left_filter_key(self, event=None) -> None:
+        """Schedule a debounced filter pass for the left side."""
+        self._schedule_filter("left")
+    
+    def _on_right_filter_key(self, event=None) -> None:
+        """Schedule a debounced filter pass for the right side."""
+        self._schedule_filter("right")
+    
+    def _on_left_list_select(self, event=None) -> None:
+        """Track selection changes in the left listbox."""
+        self._queue_tracking("left")
+    
+    def _on_right_list_select(self, event=None) -> None:
+        """Track selection changes in the right listbox."""
+        self._queue_tracking("right")
+    
+    def _queue_tracking(self, side: str) -> None:
+        """Coalesce <<ListboxSelect>> storms into one tracking update.
+        
+        A Shift+Click sweep or drag fires the event once per row it
+        crosses; queuing the update via after_idle means the manager only
+        re-reads the selection once the gesture has settled.
+        
+        Args:
+            side: 'left' or 'right'
+        """
+        if self._tracking_pending[side]:
+            return
+        self._tracking_pending[side] = True
+        self.frame.after_idle(lambda: self._flush_tracking(side))
     
-    def pack(self, **kwargs) -> None:
-        """Pack the frame with given options."""
-        self.frame.pack(**kwargs)
+    def _flush_tracking(self, side: str) -> None:
+        """Run the deferred selection-tracking update for one side."""
+        self._tracking_pending[side] = False
+        listbox = self.left_list if side == "left" else self.right_list
+        self.selection_mgr.update_tracking(side, listbox)
+    
+    def _select_all_left(self) -> None:
+        """Select every visible item in the left listbox."""
+        self.selection_mgr.select_all("left", self.left_list)
+    
+    def _deselect_all_left(self) -> None:
+        """Deselect every visible item in the left listbox."""
+        self.selection_mgr.deselect_all("left", self.left_list)
+    
+    def _select_all_right(self) -> None:
+        """Select every visible item in the right listbox."""
+        self.selection_mgr.select_all("right", self.right_list)
+    
+    def _deselect_all_right(self) -> None:
+        """Deselect every visible item in the right listbox."""
+        self.selection_mgr.deselect_all("right", self.right_list)
+    
+    def _schedule_filter(self, side: str) -> None:
+        """Debounce filter refiltering so rapid keystrokes coalesce.
+        
+        Each keystroke cancels the previous pending refresh and schedules a
+        new one 120 ms out, so a typing burst triggers one listbox rebuild
+        instead of one per character.
+        
+        Args:
+            side: 'left' or 'right'
+        """
+        pending = self._filter_after_ids[side]
+        if pending is not None:
+            self.frame.after_cancel(pending)
+        self._filter_after_ids[side] = self.frame.after(
+            120, lambda: self._run_filter(side))
+    
+    def _run_filter(self, side: str) -> None:
+        """Run the debounced filter pass for one side."""
+        self._filter_after_ids[side] = None
+        if side == "left":
+            self.selection_mgr.filter_listbox("left", self.left_list, self.left_filter)
+        else:
+            self.selection_mgr.filter_listbox("right", self.right_list, self.right_filter)
+    
+    def bulk_set(self, side: str, items: list) -> None:
+        """Replace a listbox's contents in a single Tcl call per operation.
+        
+        `Listbox.insert` forwards varargs as one Tcl command, so this costs
+        two round-trips total instead of one per item.
+        
+        Args:
+            side: 'left' or 'right'
+            items: Display names to show, in order
+        """
+        listbox = self.left_list if side == "left" else self.right_list
+        listbox.delete(0, tk.END)
+        if items:
+            listbox.insert(tk.END, *items)
     
-    def grid(self, **kwargs) -> None:
-        """Grid the frame with given options."""
-        self.frame.grid(**kwargs)
 
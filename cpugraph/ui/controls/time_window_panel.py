@@ -5,16 +5,25 @@ Contains controls for selecting time range, time selection mode, and mode filter
 
 from __future__ import annotations
 
+import logging
 import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING, Callable, List, Dict, Tuple
+import numpy as np
 import pandas as pd
 
+from .frame_delegate import FrameDelegate
+
 if TYPE_CHECKING:
     pass
 
+log = logging.getLogger(__name__)
+
+# Grid padding shared by the entry rows in this panel
+_GRID_PAD = {"padx": 4, "pady": 2}
 
-class TimeWindowPanel:
+
+class TimeWindowPanel(FrameDelegate):
     """Panel for time window filtering and selection."""
     
     def __init__(
@@ -40,19 +49,40 @@ class TimeWindowPanel:
         
         # Track available modes
         self.available_modes: List[str] = []
-        self.mode_time_ranges: Dict[str, List[Tuple[pd.Timestamp, pd.Timestamp]]] = {}
+        # Per mode: list of (start, end, start_str, end_str) tuples; the
+        # display strings are formatted once when ranges are built
+        self.mode_time_ranges: Dict[str, List[Tuple[pd.Timestamp, pd.Timestamp, str, str]]] = {}
+        
+        # Identity key of the data the modes were last computed from, so
+        # repeated refreshes against unchanged data skip the full scan
+        self._modes_cache_key = None
+        self._last_listbox_fp = None
+        
+        # Pending debounced selection-display update
+        self._sel_after_id = None
+        
+        # Parsed timestamp cache keyed by widget path: (entry text, Timestamp)
+        self._parsed_times: Dict[str, Tuple[str, pd.Timestamp]] = {}
         
         self.frame = ttk.LabelFrame(parent, text="Time Window (optional, PST timezone)")
         
+        # Malformed timestamps are rejected when an entry loses focus, and
+        # the successful parse is cached so later reads don't re-parse
+        vcmd = (self.frame.register(self._validate_datetime), "%P", "%W")
+        
         # Start time
-        ttk.Label(self.frame, text="Start:").grid(row=0, column=0, sticky="e", padx=4, pady=2)
-        self.start_entry = ttk.Entry(self.frame, width=label_entry_width)
-        self.start_entry.grid(row=0, column=1, padx=4, pady=2)
+        ttk.Label(self.frame, text="Start:").grid(row=0, column=0, sticky="e", **_GRID_PAD)
+        self.start_entry = ttk.Entry(
+            self.frame, width=label_entry_width,
+            validate="focusout", validatecommand=vcmd)
+        self.start_entry.grid(row=0, column=1, **_GRID_PAD)
         
         # End time
-        ttk.Label(self.frame, text="End:").grid(row=1, column=0, sticky="e", padx=4, pady=2)
-        self.end_entry = ttk.Entry(self.frame, width=label_entry_width)
-        self.end_entry.grid(row=1, column=1, padx=4, pady=2)
+        ttk.Label(self.frame, text="End:").grid(row=1, column=0, sticky="e", **_GRID_PAD)
+        self.end_entry = ttk.Entry(
+            self.frame, width=label_entry_width,
+            validate="focusout", validatecommand=vcmd)
+        self.end_entry.grid(row=1, column=1, **_GRID_PAD)
         
         # Time selection buttons
         time_btn_frame = ttk.Frame(self.frame)
@@ -71,10 +101,19 @@ class TimeWindowPanel:
             command=self._on_clear_selection
         ).pack(side=tk.LEFT, padx=2)
         
-        # Mode Filter Section (initially hidden, shown when Mode column exists)
+        # Mode Filter Section: only shown when a Mode column exists, so
+        # its eight widgets are built lazily on the first file that has
+        # one instead of on every startup
+        self.mode_frame = None
+        self._label_entry_width = label_entry_width
+    
+    def _ensure_mode_widgets(self) -> None:
+        """Build the mode-filter widgets on first use."""
+        if self.mode_frame is not None:
+            return
+        
         self.mode_frame = ttk.LabelFrame(self.frame, text="Filter by Mode")
         self.mode_frame.grid(row=3, column=0, columnspan=2, padx=4, pady=6, sticky="ew")
-        self.mode_frame.grid_remove()  # Hide initially
         
         # Mode selection listbox with scrollbar
         mode_list_frame = ttk.Frame(self.mode_frame)
@@ -83,19 +122,20 @@ class TimeWindowPanel:
         mode_scrollbar = ttk.Scrollbar(mode_list_frame)
         mode_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.mode_listbox = tk.Listbox(
+        # Treeview only renders the visible rows, so large mode lists
+        # don't slow the widget down the way a Listbox does
+        self.mode_tree = ttk.Treeview(
             mode_list_frame,
-            selectmode=tk.MULTIPLE,
+            show='tree',
+            selectmode='extended',
             height=6,
-            width=label_entry_width,
-            yscrollcommand=mode_scrollbar.set,
-            exportselection=False
+            yscrollcommand=mode_scrollbar.set
         )
-        self.mode_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        mode_scrollbar.config(command=self.mode_listbox.yview)
+        self.mode_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        mode_scrollbar.config(command=self.mode_tree.yview)
         
         # Bind selection change to update time ranges
-        self.mode_listbox.bind('<<ListboxSelect>>', self._on_mode_selection_changed)
+        self.mode_tree.bind('<<TreeviewSelect>>', self._on_mode_selection_changed)
         
         # Mode action buttons
         mode_btn_frame = ttk.Frame(self.mode_frame)
@@ -123,13 +163,61 @@ class TimeWindowPanel:
         self.time_ranges_label = tk.Text(
             self.mode_frame,
             height=4,
-            width=label_entry_width,
+            width=self._label_entry_width,
             wrap=tk.WORD,
             state=tk.DISABLED,
             font=("TkDefaultFont", 8)
         )
         self.time_ranges_label.pack(fill=tk.X, padx=4, pady=4)
     
+    def _validate_datetime(self, text: str, widget: str) -> bool:
+        """Validate an entry's timestamp text when it loses focus.
+        
+        Empty text is valid (the window side is simply unset). A parseable
+        timestamp is cached against the widget so get_start_datetime /
+        get_end_datetime can return it without re-parsing.
+        
+        Args:
+            text: Proposed entry contents
+            widget: Tk path of the entry being validated
+        
+        Returns:
+            True if the text is empty or a parseable timestamp
+        """
+        text = text.strip()
+        if not text:
+            self._parsed_times.pop(widget, None)
+            return True
+        try:
+            self._parsed_times[widget] = (text, pd.Timestamp(text))
+        except (ValueError, TypeError):
+            self._parsed_times.pop(widget, None)
+            return False
+        return True
+    
+    def get_start_datetime(self) -> pd.Timestamp:
+        """Return the parsed start time, or None if unset or malformed."""
+        return self._get_parsed(self.start_entry)
+    
+    def get_end_datetime(self) -> pd.Timestamp:
+        """Return the parsed end time, or None if unset or malformed."""
+        return self._get_parsed(self.end_entry)
+    
+    def _get_parsed(self, entry: ttk.Entry):
+        """Fetch the cached parse for an entry, reparsing only on change."""
+        text = entry.get().strip()
+        if not text:
+            return None
+        cached = self._parsed_times.get(str(entry))
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        try:
+            parsed = pd.Timestamp(text)
+        except (ValueError, TypeError):
+            return None
+        self._parsed_times[str(entry)] = (text, parsed)
+        return parsed
+    
     def update_available_modes(self, df: pd.DataFrame, time_column: str, mode_column: str = "Mode") -> None:
         """Update the available modes based on loaded data.
         
@@ -138,75 +226,121 @@ class TimeWindowPanel:
             time_column: Name of the time column
             mode_column: Name of the mode column (default: "Mode")
         """
+        cache_key = (id(df), len(df), time_column, mode_column)
+        if cache_key == self._modes_cache_key:
+            # Same frame, same columns: modes, ranges and the listbox are
+            # already up to date
+            return
+        
         if mode_column not in df.columns:
-            # No mode column, hide mode filtering UI
-            self.mode_frame.grid_remove()
+            # No mode column, hide mode filtering UI (if ever built)
+            if self.mode_frame is not None:
+                self.mode_frame.grid_remove()
             self.available_modes = []
             self.mode_time_ranges = {}
-            print("[Mode Filter] No 'Mode' column found, mode filtering disabled")
+            self._modes_cache_key = cache_key
+            log.debug("No 'Mode' column found, mode filtering disabled")
             return
         
+        self._ensure_mode_widgets()
+        
         # Get time column to use (prefer _plot_time if available)
         time_col = "_plot_time" if "_plot_time" in df.columns else time_column
         
-        # Extract unique modes
-        unique_modes = df[mode_column].dropna().unique().tolist()
-        unique_modes = [str(m).strip() for m in unique_modes if str(m).strip()]
-        unique_modes.sort()
+        # Extract unique modes in one vectorized pass: str.strip runs in
+        # C and pd.unique hashes the values once, instead of three
+        # Python-level passes with per-element str() calls
+        stripped = df[mode_column].dropna().astype(str).str.strip()
+        stripped = stripped[stripped != '']
+        unique_modes = np.sort(pd.unique(stripped.values)).tolist()
         
         self.available_modes = unique_modes
         
-        # Calculate time ranges for each mode
+        # Calculate time ranges for each mode in one vectorized pass:
+        # sort by time, mark a new range wherever the mode changes or the
+        # gap exceeds 5 minutes, then take per-range min/max with a single
+        # groupby instead of a Python loop over every row per mode
         self.mode_time_ranges = {}
-        for mode in unique_modes:
-            mode_df = df[df[mode_column] == mode]
-            if not mode_df.empty:
-                # Find continuous time ranges for this mode
-                time_ranges = []
-                current_start = None
-                prev_time = None
-                
-                for idx, row in mode_df.iterrows():
-                    curr_time = row[time_col]
-                    
-                    if current_start is None:
-                        # Start of a new range
-                        current_start = curr_time
-                        prev_time = curr_time
-                    elif prev_time is not None:
-                        # Check if there's a gap (>5 minutes indicates separate occurrences)
-                        time_diff = (curr_time - prev_time).total_seconds() / 60
-                        if time_diff > 5:  # 5 minute gap threshold
-                            # End previous range and start new one
-                            time_ranges.append((current_start, prev_time))
-                            current_start = curr_time
-                    
-                    prev_time = curr_time
-                
-                # Add the last range
-                if current_start is not None and prev_time is not None:
-                    time_ranges.append((current_start, prev_time))
-                
-                self.mode_time_ranges[mode] = time_ranges
-        
-        # Update listbox
-        self.mode_listbox.delete(0, tk.END)
-        for mode in self.available_modes:
-            num_occurrences = len(self.mode_time_ranges.get(mode, []))
-            display_text = f"{mode} ({num_occurrences} occurrence{'s' if num_occurrences != 1 else ''})"
-            self.mode_listbox.insert(tk.END, display_text)
+        work = df[[time_col, mode_column]].dropna(subset=[mode_column])
+        modes = work[mode_column].astype(str).str.strip()
+        work = work[modes != '']
+        if not work.empty:
+            work = work.sort_values(time_col)
+            modes = work[mode_column].astype(str).str.strip()
+            times = work[time_col]
+            # Gap detection runs on the raw int64 nanosecond values: one
+            # integer diff and compare, with no Timestamp objects or
+            # timedelta conversions. The explicit datetime64[ns] cast
+            # matters -- the column may carry another resolution (e.g.
+            # microseconds), and a plain int64 view would silently scale
+            # the 5-minute threshold
+            t_ns = times.to_numpy(dtype='datetime64[ns]').view('i8')
+            mode_vals = modes.to_numpy()
+            gap_ns = 5 * 60 * 1_000_000_000
+            new_range = np.empty(len(t_ns), dtype=bool)
+            new_range[0] = True
+            new_range[1:] = ((mode_vals[1:] != mode_vals[:-1])
+                             | (np.diff(t_ns) > gap_ns))
+            # The rows are time-sorted, so each range's min is its first
+            # row and its max its last; the boundary indices give both
+            # directly, with no groupby machinery at all
+            starts_idx = np.flatnonzero(new_range)
+            ends_idx = np.append(starts_idx[1:], len(t_ns)) - 1
+            range_modes = mode_vals[starts_idx].tolist()
+            time_index = pd.DatetimeIndex(times)
+            starts = time_index[starts_idx]
+            ends = time_index[ends_idx]
+            # Format every label in two vectorized strftime calls; the
+            # format string is parsed once instead of once per range
+            start_strs = starts.strftime('%m/%d %I:%M %p')
+            end_strs = ends.strftime('%I:%M %p')
+            for mode, start, end, start_str, end_str in zip(
+                    range_modes, starts, ends, start_strs, end_strs):
+                self.mode_time_ranges.setdefault(mode, []).append(
+                    (start, end, start_str, end_str))
+        
+        # Rebuild the listbox only when its contents would actually change;
+        # a new DataFrame with the same modes and counts keeps the current
+        # rows (and the user's selection) untouched
+        fp = (tuple(self.available_modes),
+              tuple(len(self.mode_time_ranges.get(m, []))
+                    for m in self.available_modes))
+        if fp != self._last_listbox_fp:
+            self.mode_tree.delete(*self.mode_tree.get_children())
+            for i, mode in enumerate(self.available_modes):
+                num_occurrences = len(self.mode_time_ranges.get(mode, []))
+                self.mode_tree.insert(
+                    '', 'end', iid=str(i),
+                    text=f"{mode} ({num_occurrences} occurrence{'s' if num_occurrences != 1 else ''})")
+            self._last_listbox_fp = fp
         
         # Show mode filtering UI
         self.mode_frame.grid()
-        
-        print(f"[Mode Filter] Found {len(unique_modes)} unique modes: {', '.join(unique_modes)}")
-        for mode in unique_modes:
-            ranges = self.mode_time_ranges.get(mode, [])
-            print(f"[Mode Filter]   {mode}: {len(ranges)} occurrence(s)")
+        self._modes_cache_key = cache_key
+        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Found %d unique modes: %s",
+                      len(unique_modes), ', '.join(unique_modes))
+            for mode in unique_modes:
+                ranges = self.mode_time_ranges.get(mode, [])
+                log.debug("  %s: %d occurrence(s)", mode, len(ranges))
     
     def _on_mode_selection_changed(self, event=None) -> None:
-        """Update time ranges display when mode selection changes."""
-        selected_indices = self.mode_listbox.curselection()
+        """Debounce selection changes into one display update.
+        
+        Click-dragging across the tree fires <<TreeviewSelect>> once per
+        row crossed; a short after() delay coalesces the burst so the info
+        text is rebuilt once per gesture.
+        """
+        if self._sel_after_id is not None:
+            self.mode_tree.after_cancel(self._sel_after_id)
+        self._sel_after_id = self.mode_tree.after(
+            50, self._do_update_selection_display)
+    
+    def _do_update_selection_display(self) -> None:
+        """Update time ranges display from the current mode selection."""
+        self._sel_after_id = None
+        selected_indices = sorted(int(iid) for iid in self.mode_tree.selection())
         if not selected_indices:
             self._update_time_ranges_display("")
             return
@@ -221,13 +355,13 @@ class TimeWindowPanel:
         for mode in selected_modes:
             ranges = self.mode_time_ranges.get(mode, [])
             if len(ranges) == 1:
-                start, end = ranges[0]
+                start_str, end_str = ranges[0][2], ranges[0][3]
                 info_lines.append(f"• {mode}:")
-                info_lines.append(f"  {start.strftime('%m/%d %I:%M %p')} - {end.strftime('%I:%M %p')}")
+                info_lines.append(f"  {start_str} - {end_str}")
             else:
                 info_lines.append(f"• {mode} ({len(ranges)} occurrences):")
-                for i, (start, end) in enumerate(ranges[:3], 1):  # Show first 3
-                    info_lines.append(f"  #{i}: {start.strftime('%m/%d %I:%M %p')} - {end.strftime('%I:%M %p')}")
+                for i, range_info in enumerate(ranges[:3], 1):  # Show first 3
+                    info_lines.append(f"  #{i}: {range_info[2]} - {range_info[3]}")
                 if len(ranges) > 3:
                     info_lines.append(f"  ... and {len(ranges) - 3} more")
         
@@ -239,46 +373,47 @@ class TimeWindowPanel:
         Args:
             text: Text to display
         """
+        # replace() swaps the content in one Tcl command instead of a
+        # delete round-trip followed by an insert
         self.time_ranges_label.config(state=tk.NORMAL)
-        self.time_ranges_label.delete(1.0, tk.END)
-        self.time_ranges_label.insert(1.0, text)
+        self.time_ranges_label.replace("1.0", tk.END, text)
         self.time_ranges_label.config(state=tk.DISABLED)
     
     def _select_all_modes(self) -> None:
-        """Select all modes in the listbox."""
-        self.mode_listbox.select_set(0, tk.END)
-        self._on_mode_selection_changed()
+        """Select all modes in the tree."""
+        # Unlike a Listbox, programmatic Treeview selection fires
+        # <<TreeviewSelect>>, so the debounced handler updates the display
+        self.mode_tree.selection_set(self.mode_tree.get_children())
     
     def _clear_all_modes(self) -> None:
         """Clear all mode selections."""
-        self.mode_listbox.selection_clear(0, tk.END)
-        self._on_mode_selection_changed()
+        self.mode_tree.selection_remove(self.mode_tree.get_children())
     
     def _apply_mode_filter(self) -> None:
         """Apply the selected mode filter to update time window."""
-        selected_indices = self.mode_listbox.curselection()
+        selected_indices = sorted(int(iid) for iid in self.mode_tree.selection())
         if not selected_indices:
-            print("[Mode Filter] No modes selected")
+            log.debug("No modes selected")
             return
         
         # Get selected modes
         selected_modes = [self.available_modes[i] for i in selected_indices]
         
-        # Collect all time ranges for selected modes
-        all_ranges = []
-        for mode in selected_modes:
-            all_ranges.extend(self.mode_time_ranges.get(mode, []))
+        # Collect the range lists for the selected modes
+        mode_ranges = [self.mode_time_ranges.get(m, []) for m in selected_modes]
+        mode_ranges = [ranges for ranges in mode_ranges if ranges]
         
-        if not all_ranges:
-            print("[Mode Filter] No time ranges found for selected modes")
+        if not mode_ranges:
+            log.debug("No time ranges found for selected modes")
             return
         
-        # Sort ranges by start time
-        all_ranges.sort(key=lambda x: x[0])
-        
-        # Set start time to earliest range
-        earliest_start = min(r[0] for r in all_ranges)
-        latest_end = max(r[1] for r in all_ranges)
+        # Only the overall span is needed, and each mode's ranges are
+        # already chronological, so take the min of the first starts and
+        # the max of the last ends -- O(modes) instead of sorting and
+        # scanning every range
+        earliest_start = min(ranges[0][0] for ranges in mode_ranges)
+        latest_end = max(ranges[-1][1] for ranges in mode_ranges)
+        total_ranges = sum(len(ranges) for ranges in mode_ranges)
         
         # Update start/end entry fields
         self.start_entry.delete(0, tk.END)
@@ -288,12 +423,15 @@ class TimeWindowPanel:
         self.end_entry.insert(0, latest_end.strftime('%m/%d/%Y %I:%M:%S %p'))
         
         # Log the filtering
-        print(f"[Mode Filter] Applied filter for modes: {', '.join(selected_modes)}")
-        print(f"[Mode Filter] Time range: {earliest_start.strftime('%m/%d/%Y %I:%M %p')} - {latest_end.strftime('%I:%M %p')}")
-        
-        if len(all_ranges) > 1:
-            print(f"[Mode Filter] Note: Selected modes have {len(all_ranges)} separate time ranges")
-            print(f"[Mode Filter] Showing full span. Use 'Plot' to visualize (gaps will be visible)")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Applied filter for modes: %s", ', '.join(selected_modes))
+            log.debug("Time range: %s - %s",
+                      earliest_start.strftime('%m/%d/%Y %I:%M %p'),
+                      latest_end.strftime('%I:%M %p'))
+        
+        if total_ranges > 1:
+            log.debug("Note: Selected modes have %d separate time ranges", total_ranges)
+            log.debug("Showing full span. Use 'Plot' to visualize (gaps will be visible)")
     
     def _on_toggle_selection(self) -> None:
         """Handle toggle time selection button click."""
@@ -305,11 +443,4 @@ class TimeWindowPanel:
         if self.clear_callback:
             self.clear_callback()
     
-    def pack(self, **kwargs) -> None:
-        """Pack the frame with given options."""
-        self.frame.pack(**kwargs)
-    
-    def grid(self, **kwargs) -> None:
-        """Grid the frame with given options."""
-        self.frame.grid(**kwargs)
 
@@ -6,6 +6,7 @@ properties for selected data series.
 
 from __future__ import annotations
 
+import logging
 import tkinter as tk
 from tkinter import colorchooser, messagebox, ttk
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -13,6 +14,8 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 if TYPE_CHECKING:
     pass
 
+log = logging.getLogger(__name__)
+
 
 class SeriesCustomizeDialog:
     """Dialog for customizing series properties (colors, line styles, markers)."""
@@ -51,6 +54,29 @@ class SeriesCustomizeDialog:
             Updated series_properties dict if applied, None if cancelled
         """
         self._create_dialog()
+        # Extract properties from the plotted Line2D objects in one pass
+        # per axis, then resolve the effective properties for every series
+        # up front; the per-row builders read from the resolved dict
+        # instead of probing series_properties and matplotlib getters
+        self._line_props_cache = {}
+        for side in ("left", "right"):
+            for col, line in self.last_series_lines.get(side, {}).items():
+                if col in self._line_props_cache:
+                    continue
+                try:
+                    marker = line.get_marker()
+                    self._line_props_cache[col] = {
+                        'color': line.get_color(),
+                        'linestyle': line.get_linestyle() or '-',
+                        'linewidth': float(line.get_linewidth()),
+                        'marker': marker if marker not in [None, 'None'] else None,
+                        'markersize': float(line.get_markersize()),
+                    }
+                except Exception:
+                    pass
+        self._resolved_props = {
+            col: self._get_current_properties(col) for col in self.all_series
+        }
         self._create_controls()
         self._create_buttons()
         
@@ -67,7 +93,7 @@ class SeriesCustomizeDialog:
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
         
-        print(f"[Customize] Opening dialog for {len(self.all_series)} series")
+        log.debug("Opening dialog for %d series", len(self.all_series))
     
     def _create_controls(self) -> None:
         """Create the scrollable frame with customization controls."""
@@ -90,26 +116,71 @@ class SeriesCustomizeDialog:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Create customization controls for each series
-        for idx, col in enumerate(self.all_series):
-            self._create_series_controls(scrollable_frame, col)
+        # Create customization controls in idle-time batches: the dialog
+        # paints immediately with the first screenful and the remaining
+        # rows stream in while the event loop is idle
+        self._scrollable_frame = scrollable_frame
+        self._pending_series = list(self.all_series)
+        self._build_next_batch()
         
-        # Enable mouse wheel scrolling
+        # Enable mouse wheel scrolling only while the pointer is over the
+        # canvas: a permanent bind_all would fire for every wheel event in
+        # the whole application while the dialog exists
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        canvas.bind("<Enter>",
+                    lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
         
         # Cleanup binding when dialog closes
         def on_close():
             canvas.unbind_all("<MouseWheel>")
-            self.dialog.destroy()
+            self._staged_destroy()
         
         self.dialog.protocol("WM_DELETE_WINDOW", on_close)
         
         # Store canvas for cleanup
         self._canvas = canvas
     
+    def _build_next_batch(self) -> None:
+        """Build the next batch of series rows, rescheduling until done."""
+        batch, self._pending_series = (
+            self._pending_series[:16], self._pending_series[16:])
+        for col in batch:
+            self._create_series_controls(self._scrollable_frame, col)
+        if self._pending_series and self.dialog.winfo_exists():
+            self.dialog.after_idle(self._build_next_batch)
+    
+    def _staged_destroy(self) -> None:
+        """Tear the dialog down without freezing the parent window.
+        
+        Destroying hundreds of row widgets in one synchronous call blocks
+        the UI thread. Hide the window and release the grab immediately,
+        then destroy the rows in idle-time batches before dropping the
+        window itself.
+        """
+        self._pending_series = []
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        rows = self._scrollable_frame.winfo_children()
+        
+        def destroy_batch(i=0):
+            for frame in rows[i:i + 32]:
+                frame.destroy()
+            if i + 32 < len(rows):
+                self.parent.after_idle(destroy_batch, i + 32)
+            else:
+                self.dialog.destroy()
+        
+        destroy_batch()
+    
+    def _ensure_all_rows(self) -> None:
+        """Finish building any rows still pending (before apply/reset)."""
+        while self._pending_series:
+            col = self._pending_series.pop(0)
+            self._create_series_controls(self._scrollable_frame, col)
+    
     def _create_series_controls(self, parent: ttk.Frame, col: str) -> None:
         """Create customization controls for a single series.
         
@@ -118,7 +189,7 @@ class SeriesCustomizeDialog:
             col: Column name for this series
         """
         # Get current properties
-        props = self._get_current_properties(col)
+        props = self._resolved_props[col]
         
         current_color = props.get('color', None)
         current_linestyle = props.get('linestyle', '-')
@@ -151,7 +222,7 @@ class SeriesCustomizeDialog:
                 if color[1]:  # color[1] is hex string
                     color_var.set(color[1])
                     color_display.config(bg=color[1])
-                    print(f"[Customize] {col_name}: color set to {color[1]}")
+                    log.debug("%s: color set to %s", col_name, color[1])
             return choose_color
         
         ttk.Button(
@@ -163,7 +234,7 @@ class SeriesCustomizeDialog:
             def reset_color():
                 color_var.set("")
                 color_display.config(bg="white")
-                print(f"[Customize] {col_name}: color reset to default")
+                log.debug("%s: color reset to default", col_name)
             return reset_color
         
         ttk.Button(
@@ -171,40 +242,49 @@ class SeriesCustomizeDialog:
             command=make_reset_color(col, color_var, color_display)
         ).pack(side=tk.LEFT, padx=5)
         
+        # The remaining controls are backed by Tk variables so
+        # _apply_changes reads plain scalar vars instead of querying each
+        # widget through its Tcl command
+        
         # Line style
         ttk.Label(series_frame, text="Line Style:").grid(row=1, column=0, sticky="e", padx=5, pady=3)
-        linestyle_combo = ttk.Combobox(series_frame, values=self.linestyles, width=10, state="readonly")
-        linestyle_combo.set(current_linestyle)
+        linestyle_var = tk.StringVar(value=current_linestyle)
+        linestyle_combo = ttk.Combobox(
+            series_frame, values=self.linestyles, width=10, state="readonly",
+            textvariable=linestyle_var)
         linestyle_combo.grid(row=1, column=1, sticky="w", padx=5, pady=3)
         
         # Line width
         ttk.Label(series_frame, text="Line Width:").grid(row=1, column=2, sticky="e", padx=5, pady=3)
-        linewidth_spinbox = ttk.Spinbox(series_frame, from_=0.5, to=10.0, increment=0.5, width=8)
-        linewidth_spinbox.set(current_linewidth)
+        linewidth_var = tk.StringVar(value=str(current_linewidth))
+        linewidth_spinbox = ttk.Spinbox(
+            series_frame, from_=0.5, to=10.0, increment=0.5, width=8,
+            textvariable=linewidth_var)
         linewidth_spinbox.grid(row=1, column=3, sticky="w", padx=5, pady=3)
         
         # Marker style
         ttk.Label(series_frame, text="Marker:").grid(row=2, column=0, sticky="e", padx=5, pady=3)
-        marker_combo = ttk.Combobox(series_frame, values=self.markers, width=10, state="readonly")
-        try:
-            marker_combo.set(str(current_marker))
-        except Exception:
-            marker_combo.set('None')
+        marker_var = tk.StringVar(value=str(current_marker))
+        marker_combo = ttk.Combobox(
+            series_frame, values=self.markers, width=10, state="readonly",
+            textvariable=marker_var)
         marker_combo.grid(row=2, column=1, sticky="w", padx=5, pady=3)
         
         # Marker size
         ttk.Label(series_frame, text="Marker Size:").grid(row=2, column=2, sticky="e", padx=5, pady=3)
-        markersize_spinbox = ttk.Spinbox(series_frame, from_=1, to=20, increment=1, width=8)
-        markersize_spinbox.set(current_markersize)
+        markersize_var = tk.StringVar(value=str(current_markersize))
+        markersize_spinbox = ttk.Spinbox(
+            series_frame, from_=1, to=20, increment=1, width=8,
+            textvariable=markersize_var)
         markersize_spinbox.grid(row=2, column=3, sticky="w", padx=5, pady=3)
         
-        # Store widgets
+        # Store the backing variables
         self.series_widgets[col] = {
             'color_var': color_var,
-            'linestyle': linestyle_combo,
-            'linewidth': linewidth_spinbox,
-            'marker': marker_combo,
-            'markersize': markersize_spinbox
+            'linestyle': linestyle_var,
+            'linewidth': linewidth_var,
+            'marker': marker_var,
+            'markersize': markersize_var
         }
     
     def _get_current_properties(self, col: str) -> Dict[str, Any]:
@@ -216,30 +296,12 @@ class SeriesCustomizeDialog:
         Returns:
             Dictionary of current properties
         """
-        # Start with explicit custom properties if user set any previously
-        props = dict(self.series_properties.get(col, {}))
-        
-        # If no explicit customization, try to read from last plotted line
-        if not props:
-            line = None
-            if col in self.last_series_lines.get("left", {}):
-                line = self.last_series_lines["left"].get(col)
-            if line is None and col in self.last_series_lines.get("right", {}):
-                line = self.last_series_lines["right"].get(col)
-            if line is not None:
-                try:
-                    # Extract live properties from the matplotlib Line2D
-                    props = {
-                        'color': line.get_color(),
-                        'linestyle': line.get_linestyle() or '-',
-                        'linewidth': float(line.get_linewidth()),
-                        'marker': line.get_marker() if line.get_marker() not in [None, 'None'] else None,
-                        'markersize': float(line.get_markersize()),
-                    }
-                except Exception:
-                    props = {}
-        
-        return props
+        # Explicit custom properties win; otherwise fall back to the
+        # values extracted from the last plotted lines
+        props = self.series_properties.get(col)
+        if props:
+            return dict(props)
+        return dict(self._line_props_cache.get(col, {}))
     
     def _create_buttons(self) -> None:
         """Create the button frame at the bottom of the dialog."""
@@ -248,10 +310,11 @@ class SeriesCustomizeDialog:
         
         ttk.Button(button_frame, text="Apply", command=self._apply_changes).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Reset All", command=self._reset_all).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self._staged_destroy).pack(side=tk.LEFT, padx=5)
     
     def _apply_changes(self) -> None:
         """Apply customizations to series_properties."""
+        self._ensure_all_rows()
         updated_properties = {}
         
         for col, widgets in self.series_widgets.items():
@@ -270,9 +333,10 @@ class SeriesCustomizeDialog:
                 'markersize': markersize
             }
             
-            print(f"[Customize] {col}: color={color if color else 'auto'}, "
-                  f"linestyle={linestyle}, linewidth={linewidth}, "
-                  f"marker={marker}, markersize={markersize}")
+            log.debug("%s: color=%s, linestyle=%s, linewidth=%s, "
+                      "marker=%s, markersize=%s",
+                      col, color if color else 'auto', linestyle,
+                      linewidth, marker, markersize)
         
         # Merge with existing properties
         self.result = dict(self.series_properties)
@@ -282,15 +346,16 @@ class SeriesCustomizeDialog:
             "Success",
             f"Customizations applied to {len(self.series_widgets)} series.\nClick 'Plot' to see changes."
         )
-        self.dialog.destroy()
+        self._staged_destroy()
     
     def _reset_all(self) -> None:
         """Reset all customizations for selected series."""
+        self._ensure_all_rows()
         # Create result with customizations removed for these series
         self.result = {k: v for k, v in self.series_properties.items() 
                        if k not in self.series_widgets}
         
-        print(f"[Customize] Reset all customizations for {len(self.series_widgets)} series")
+        log.debug("Reset all customizations for %d series", len(self.series_widgets))
         messagebox.showinfo("Reset", "All customizations cleared. Click 'Plot' to see changes.")
-        self.dialog.destroy()
+        self._staged_destroy()
 
@@ -7,10 +7,17 @@ which series are selected for plotting.
 
 from __future__ import annotations
 
+import logging
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, List, Set
 
+log = logging.getLogger(__name__)
+
+# Placeholder text shown by the filter entries (see PlaceholderEntry);
+# compared verbatim so the placeholder case skips the lowercasing
+_PLACEHOLDER = "Filter..."
+
 
 class SeriesSelectionManager:
     """Manages selection state and filtering for series listboxes.
@@ -20,8 +27,17 @@ class SeriesSelectionManager:
     - Filtering listboxes based on search text
     - Select all / deselect all operations
     - Converting between display names and column names
+    
+    Invariant: left_selected/right_selected are kept current by the
+    listboxes' <<ListboxSelect>> bindings (via update_tracking), so
+    filter_listbox can trust them without re-reading the selection.
     """
     
+    # Separator row shown between selected and filtered items, and the
+    # prefix used to recognize it; built once instead of per call
+    _SEPARATOR = "\u2500" * 40
+    _SEP_PREFIX = "\u2500"
+    
     def __init__(
         self,
         all_columns: List[str],
@@ -44,11 +60,27 @@ class SeriesSelectionManager:
         else:
             self.column_display_map = {v: k for k, v in column_to_display.items()}
         
+        # Parallel display-name arrays, case-folded once per load, so the
+        # per-keystroke filter never re-derives or re-lowercases names
+        self._display_names = [column_to_display.get(c, c) for c in all_columns]
+        self._display_lower = [name.lower() for name in self._display_names]
+        
         # Track selected items (as display names)
         self.left_selected: Set[str] = set()
         self.right_selected: Set[str] = set()
         
-        print(f"[Selection Manager] Initialized with {len(all_columns)} columns")
+        # Last item list pushed to each listbox, so refreshes that would
+        # reproduce identical contents skip the Tcl traffic entirely
+        self._last_rendered: Dict[str, List[str]] = {}
+        # (filter text, selection snapshot) of the last rebuild, so calls
+        # where neither changed skip even the Python-side list build
+        self._last_filter_key: Dict[str, tuple] = {}
+        # Per side: (filter text, selection snapshot, matched indices,
+        # selected names) of the last rebuild, reused to narrow the scan
+        # while the user extends the filter text
+        self._match_state: Dict[str, tuple] = {}
+        
+        log.info("Initialized with %d columns", len(all_columns))
     
     def update_columns(
         self,
@@ -71,10 +103,16 @@ class SeriesSelectionManager:
         else:
             self.column_display_map = {v: k for k, v in column_to_display.items()}
         
+        self._display_names = [column_to_display.get(c, c) for c in all_columns]
+        self._display_lower = [name.lower() for name in self._display_names]
+        
         self.left_selected.clear()
         self.right_selected.clear()
+        self._last_rendered.clear()
+        self._last_filter_key.clear()
+        self._match_state.clear()
         
-        print(f"[Selection Manager] Updated with {len(all_columns)} columns, selections cleared")
+        log.info("Updated with %d columns, selections cleared", len(all_columns))
     
     def update_tracking(self, side: str, listbox: tk.Listbox) -> None:
         """Update the selection tracking set when user clicks on listbox items.
@@ -88,17 +126,19 @@ class SeriesSelectionManager:
         """
         selected_set = self.left_selected if side == "left" else self.right_selected
         
-        # Update tracking with current selections (as display names)
+        # Update tracking with current selections (as display names).
+        # Snapshot the whole listbox in one Tcl call and index locally
+        # instead of a get(i) round-trip per selected row.
         selected_set.clear()
         indices = listbox.curselection()
-        for i in indices:
-            item = listbox.get(i)
-            # Skip separator lines
-            if not item.startswith("─"):
-                selected_set.add(item)
+        if indices:
+            all_items = listbox.get(0, tk.END)
+            new_items = {all_items[i] for i in indices}
+            new_items.discard(self._SEPARATOR)
+            selected_set |= new_items
         
         # Log selection changes for debugging
-        print(f"[Selection] {side.capitalize()} axis: {len(selected_set)} items selected")
+        log.debug("%s axis: %d items selected", side, len(selected_set))
     
     def filter_listbox(
         self,
@@ -122,55 +162,83 @@ class SeriesSelectionManager:
         
         selected_set = self.left_selected if side == "left" else self.right_selected
         
-        # Update selected items tracking before clearing
-        for idx in listbox.curselection():
-            item = listbox.get(idx)
-            if not item.startswith("─"):
-                selected_set.add(item)
-        
         # Get filter text
-        filter_text = filter_entry.get().strip().lower()
-        if filter_text == "filter...":
-            filter_text = ""
-        
-        # Clear and repopulate listbox
-        listbox.delete(0, tk.END)
-        
-        # Track items we've already added
-        added_items = set()
-        selected_count = 0
-        matched_count = 0
-        
-        # FIRST: Add all previously selected items (always visible)
-        for col in self.all_columns:
-            display_name = self.column_to_display.get(col, col)
-            if display_name in selected_set:
-                listbox.insert(tk.END, display_name)
-                listbox.selection_set(tk.END)
-                added_items.add(display_name)
-                selected_count += 1
-        
-        # Add separator if we have selected items and a filter is active
+        raw = filter_entry.get().strip()
+        filter_text = "" if raw == _PLACEHOLDER else raw.lower()
+        
+        # Same filter text against the same selection produces the same
+        # list; return before rebuilding anything
+        key = (filter_text, frozenset(selected_set))
+        if key == self._last_filter_key.get(side):
+            return
+        
+        # Build the new contents in Python first. Tk only paints the rows
+        # inside the viewport, so the cost of a refresh is the delete/insert
+        # traffic, not the drawing -- and that traffic can be skipped when
+        # the rebuilt list is identical to what the widget already shows.
+        names = self._display_names
+        lowers = self._display_lower
+        prev = self._match_state.get(side)
+        if (filter_text and prev is not None and prev[0]
+                and prev[1] == key[1]
+                and filter_text != prev[0]
+                and filter_text.startswith(prev[0])):
+            # The user extended the previous filter text against the same
+            # selection: only the previous matches can still match, so
+            # rescan that subset instead of every column
+            selected_display = prev[3]
+            matched_idx = [i for i in prev[2] if filter_text in lowers[i]]
+            matched_display = [names[i] for i in matched_idx]
+        else:
+            # Classify each column in a single pass: selected items always
+            # stay visible (and sort first), the rest must match the filter
+            # against the display name (column name plus description).
+            # Local bindings keep the hot loop on LOAD_FAST instead of
+            # attribute/method lookups per column
+            sel = selected_set
+            selected_display = []
+            matched_display = []
+            matched_idx = []
+            append_selected = selected_display.append
+            append_matched = matched_display.append
+            append_idx = matched_idx.append
+            for i, display_name in enumerate(names):
+                if display_name in sel:
+                    append_selected(display_name)
+                elif not filter_text or filter_text in lowers[i]:
+                    append_matched(display_name)
+                    append_idx(i)
+        self._match_state[side] = (filter_text, key[1], matched_idx,
+                                   selected_display)
+        selected_count = len(selected_display)
+        matched_count = len(matched_display)
+        
+        items = list(selected_display)
         if selected_count > 0 and filter_text:
-            listbox.insert(tk.END, "─" * 40)
-            added_items.add("─" * 40)
-        
-        # SECOND: Add filtered items (that aren't already selected)
-        for col in self.all_columns:
-            display_name = self.column_to_display.get(col, col)
-            # Skip if already added, or if doesn't match filter
-            if display_name in added_items:
-                continue
-            # Filter based on display name (which includes both column name and description)
-            if not filter_text or filter_text in display_name.lower():
-                listbox.insert(tk.END, display_name)
-                matched_count += 1
+            items.append(self._SEPARATOR)
+        items.extend(matched_display)
+        
+        # Repopulate only when the contents actually changed (e.g. arrow or
+        # modifier keys released in the filter entry leave them untouched)
+        if items != self._last_rendered.get(side):
+            # insert() takes varargs and sends them as one Tcl command, so
+            # the whole repopulation is a handful of round-trips, not O(N)
+            listbox.delete(0, tk.END)
+            if items:
+                listbox.insert(tk.END, *items)
+            if selected_count:
+                listbox.selection_set(0, selected_count - 1)
+            self._last_rendered[side] = items
+        self._last_filter_key[side] = key
         
         # Log filtering activity
         if filter_text:
-            print(f"[Filter] {side.capitalize()} axis: '{filter_text}' matched {matched_count} new + {selected_count} selected = {matched_count + selected_count} total items")
+            log.debug("%s axis: '%s' matched %d new + %d selected = %d total items",
+                      side, filter_text, matched_count, selected_count,
+                      matched_count + selected_count)
         else:
-            print(f"[Filter] {side.capitalize()} axis: No filter, showing all {len(self.all_columns)} columns ({selected_count} selected)")
+            log.debug("%s axis: no filter, showing all %d columns (%d selected)",
+                      side, len(self.all_columns), selected_count)
     
     def select_all(self, side: str, listbox: tk.Listbox) -> None:
         """Select all visible items in the listbox.
@@ -181,16 +249,28 @@ class SeriesSelectionManager:
         """
         selected_set = self.left_selected if side == "left" else self.right_selected
         
-        # Select all visible items (except separator)
-        count = 0
-        for i in range(listbox.size()):
-            item = listbox.get(i)
-            if not item.startswith("─"):
-                listbox.selection_set(i)
-                selected_set.add(item)
-                count += 1
-        
-        print(f"[Select All] {side.capitalize()} axis: Selected {count} visible columns")
+        # One snapshot, then selection_set over contiguous runs of
+        # non-separator rows -- a few Tcl commands instead of one per row
+        all_items = listbox.get(0, tk.END)
+        run_start = None
+        for i, item in enumerate(all_items):
+            if item.startswith(self._SEP_PREFIX):
+                if run_start is not None:
+                    listbox.selection_set(run_start, i - 1)
+                    run_start = None
+            elif run_start is None:
+                run_start = i
+        if run_start is not None:
+            listbox.selection_set(run_start, len(all_items) - 1)
+        
+        # Grow the tracking set with one bulk union instead of per-item
+        # add calls
+        visible = {item for item in all_items
+                   if not item.startswith(self._SEP_PREFIX)}
+        selected_set |= visible
+        count = len(visible)
+        
+        log.debug("%s axis: selected %d visible columns", side, count)
     
     def deselect_all(self, side: str, listbox: tk.Listbox) -> None:
         """Deselect all items in the listbox.
@@ -201,18 +281,19 @@ class SeriesSelectionManager:
         """
         selected_set = self.left_selected if side == "left" else self.right_selected
         
-        # Get currently visible items to remove from tracking (skip separator)
-        visible_items = [listbox.get(i) for i in range(listbox.size()) 
-                        if not listbox.get(i).startswith("─")]
+        # Snapshot the listbox in one Tcl call and drop the separator,
+        # instead of two get(i) round-trips per row
+        all_items = listbox.get(0, tk.END)
+        visible_items = [item for item in all_items
+                         if not item.startswith(self._SEP_PREFIX)]
         
         # Clear selection
         listbox.selection_clear(0, tk.END)
         
         # Remove only visible items from tracking set
-        for item in visible_items:
-            selected_set.discard(item)
+        selected_set.difference_update(visible_items)
         
-        print(f"[Deselect All] {side.capitalize()} axis: Deselected {len(visible_items)} visible columns")
+        log.debug("%s axis: deselected %d visible columns", side, len(visible_items))
     
     def get_selected_columns(self, side: str, listbox: tk.Listbox) -> List[str]:
         """Get selected items from a listbox and return actual column names.
@@ -228,51 +309,32 @@ class SeriesSelectionManager:
         """
         selected_set = self.left_selected if side == "left" else self.right_selected
         
-        # Update tracking with current selections (as display names)
+        # Update tracking with current selections (as display names),
+        # snapshotting the listbox once instead of a get() per row
         selected_set.clear()
         indices = listbox.curselection()
-        for i in indices:
-            item = listbox.get(i)
-            # Skip separator lines
-            if not item.startswith("─"):
-                selected_set.add(item)
+        if indices:
+            all_items = listbox.get(0, tk.END)
+            new_items = {all_items[i] for i in indices}
+            new_items.discard(self._SEPARATOR)
+            selected_set |= new_items
         
         # Convert display names to actual column names for plotting
         actual_columns = []
         for display_name in selected_set:
             # Skip separator lines (safety check)
-            if display_name.startswith("─"):
+            if display_name.startswith(self._SEP_PREFIX):
                 continue
             actual_col = self.column_display_map.get(display_name, display_name)
             actual_columns.append(actual_col)
         
         return actual_columns
     
-    def on_filter_focus_in(self, entry: ttk.Entry) -> None:
-        """Clear placeholder text when filter box is focused.
-        
-        Args:
-            entry: The filter entry widget
-        """
-        if entry.get() == "Filter...":
-            entry.delete(0, tk.END)
-            entry.config(foreground="black")
-    
-    def on_filter_focus_out(self, entry: ttk.Entry) -> None:
-        """Restore placeholder text if filter box is empty.
-        
-        Args:
-            entry: The filter entry widget
-        """
-        if not entry.get():
-            entry.insert(0, "Filter...")
-            entry.config(foreground="gray")
-    
     def clear_selections(self) -> None:
         """Clear all selections on both axes."""
         self.left_selected.clear()
         self.right_selected.clear()
-        print("[Selection Manager] All selections cleared")
+        log.debug("All selections cleared")
     
     def get_selection_count(self, side: str) -> int:
         """Get the number of selected items for an axis.
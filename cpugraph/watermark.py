@@ -5,33 +5,91 @@ from __future__ import annotations
 import io
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PIL import Image
 
+# CairoSVG import result, resolved at most once: the module itself if
+# importable, False if not, None while still unknown
+_cairosvg = None
+
+
+def _get_cairosvg():
+    """Return the cairosvg module, or None when it isn't installed."""
+    global _cairosvg
+    if _cairosvg is None:
+        try:
+            import cairosvg
+            _cairosvg = cairosvg
+        except ImportError:
+            _cairosvg = False
+    return _cairosvg or None
+
+
+# Loaded watermark images keyed by (resolved path, mtime). SVG
+# rasterization and PNG decode are expensive relative to a dict lookup,
+# and callers treat the returned image as read-only, so the cached
+# instance is shared.
+_WATERMARK_CACHE: Dict[Tuple[str, float], Image.Image] = {}
+
+
+def clear_watermark_cache() -> None:
+    """Drop any cached watermark images."""
+    _WATERMARK_CACHE.clear()
+
 
 def load_watermark_image(base_path: str | os.PathLike[str] | None = None) -> Optional[Image.Image]:
     """Load the Orbital watermark image if available.
 
     The loader prefers the PNG asset and falls back to the SVG version when
     CairoSVG is installed. The returned value is a ``PIL.Image`` instance in
-    RGBA mode or ``None`` when no asset could be loaded.
+    RGBA mode or ``None`` when no asset could be loaded. Loaded images are
+    cached by path and modification time, so repeated calls for an
+    unchanged asset return the same instance.
     """
 
     search_path = Path(base_path or Path(__file__).resolve().parent)
 
+    # One stat per candidate serves as both the existence check and the
+    # cache key; a missing file just falls through to the next candidate
     png_path = search_path / "OrbitalDarkPurple.png"
-    if png_path.exists():
-        return Image.open(png_path).convert("RGBA")
+    try:
+        key = (str(png_path), png_path.stat().st_mtime)
+    except OSError:
+        key = None
+    if key is not None:
+        image = _WATERMARK_CACHE.get(key)
+        if image is None:
+            try:
+                image = Image.open(png_path)
+                # Skip the convert copy when the asset is already RGBA
+                if image.mode != "RGBA":
+                    image = image.convert("RGBA")
+            except OSError:
+                image = None
+            else:
+                _WATERMARK_CACHE[key] = image
+        if image is not None:
+            return image
 
     svg_path = search_path / "OrbitalDarkPurple.svg"
-    if svg_path.exists():
+    try:
+        key = (str(svg_path), svg_path.stat().st_mtime)
+    except OSError:
+        return None
+    image = _WATERMARK_CACHE.get(key)
+    if image is None:
+        cairosvg = _get_cairosvg()
+        if cairosvg is None:
+            return None
         try:
-            import cairosvg
-
-            png_bytes = cairosvg.svg2png(url=str(svg_path), output_width=800)
-            return Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+            # Stream the rasterized PNG straight into the buffer instead
+            # of materializing an intermediate bytes object
+            buf = io.BytesIO()
+            cairosvg.svg2png(url=str(svg_path), output_width=800, write_to=buf)
+            buf.seek(0)
+            image = Image.open(buf).convert("RGBA")
         except Exception:
             return None
-
-    return None
+        _WATERMARK_CACHE[key] = image
+    return image